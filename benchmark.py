@@ -0,0 +1,233 @@
+"""
+Benchmark of the bot's per-card overhead against the offline fixture site
+
+Runs the GUI-free MessagingEngine in-process across fixture pages of 20, 200
+and 2,000 cards and reports wall time, CPU time, WebDriver round-trips and
+RSS for the Python process and Chrome. The delays of the bot's pacing policy
+are stubbed out (or, with --pacing real, slept and subtracted) so only tool
+overhead remains. No display is needed; Chrome runs headless.
+
+    python benchmark.py --cards 20 200 2000 --output bench_results.json
+    python benchmark.py --baseline bench_results.json --output bench_new.json
+    python benchmark.py --cards 200 --cprofile bench_profile
+    python benchmark.py --lean --baseline bench_results.json --output bench_lean.json
+"""
+import argparse
+import cProfile
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import threading
+import time
+
+from bot_engine import MessagingEngine
+from fixture_site import FixtureConfig, start_fixture_server
+from memory_guard import process_tree
+from webdriver_profiler import WebDriverProfiler
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+BENCHMARK_MESSAGE = "Hi there, this is a benchmark message."
+
+
+class PacingClock:
+    """Sleep function for the bot's pacing policy that accounts for its delays"""
+
+    def __init__(self, real_sleep):
+        self.real_sleep = real_sleep
+        self.slept = 0.0
+
+    def sleep(self, seconds):
+        self.slept += seconds
+        if self.real_sleep:
+            time.sleep(seconds)
+
+
+def tree_usage(root_pid):
+    """CPU seconds and RSS in MB summed over a process tree"""
+    cpu, rss_kb = 0.0, 0
+    for pid in process_tree(root_pid):
+        try:
+            with open(f"/proc/{pid}/stat", "r") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            cpu += (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+            with open(f"/proc/{pid}/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        rss_kb += int(line.split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    return cpu, rss_kb / 1024
+
+
+class PeakSampler:
+    """Samples the RSS of a process tree in the background and keeps the peak"""
+
+    def __init__(self, root_pid, interval=0.5):
+        self.root_pid = root_pid
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_mb = max(self.peak_mb, tree_usage(self.root_pid)[1])
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+class LogFileSink:
+    """Engine event sink that appends log lines to a file for later inspection"""
+
+    def __init__(self, path):
+        self.file = open(path, "a", encoding="utf-8")
+
+    def __call__(self, event, *args):
+        if event == "log":
+            self.file.write(f"[{time.strftime('%H:%M:%S')}] {args[0]}\n")
+
+    def close(self):
+        self.file.close()
+
+
+def run_scenario(cards, pages, real_pacing, cprofile_path=None, lean=False):
+    """Run the engine over one fixture configuration and return its measurements"""
+    server = start_fixture_server(FixtureConfig(cards=cards, pages=pages, render_delay_ms=100,
+                                                modal_delay_ms=50, avatar_kb=4))
+    workdir = tempfile.mkdtemp(prefix="cfl_bench_")
+    previous_dir = os.getcwd()
+    os.chdir(workdir)  # Keep the dedup store, journal and logs of each run apart
+    clock = PacingClock(real_pacing)
+    engine = MessagingEngine(start_url=f"{server.base_url}/search?page=1",
+                             headless=os.environ.get("COFOUNDERSLAB_HEADLESS", "1") == "1")
+    log_sink = LogFileSink(os.path.join(workdir, "engine.log"))
+    engine.subscribe(log_sink)
+    engine.pacing.sleep = clock.sleep
+    engine.pacing.settings["daily_cap"] = engine.pacing.settings["session_cap"] = cards * pages
+    engine.lean_mode = lean
+    engine.meter_navigations = True  # Bytes per page are reported with and without lean mode
+    try:
+        if not engine.open_site():
+            raise RuntimeError(f"Chrome could not be started, see {workdir}/engine.log")
+        chrome_pid = engine.driver.service.process.pid
+        profiler = WebDriverProfiler(engine.driver)
+
+        clock.slept = 0.0
+        chrome_cpu_before, _ = tree_usage(chrome_pid)
+        cpu_before = time.process_time()
+        started = time.perf_counter()
+        with PeakSampler(chrome_pid) as sampler:
+            if cprofile_path:
+                python_profiler = cProfile.Profile()
+                python_profiler.runcall(engine.run_in_foreground, BENCHMARK_MESSAGE)
+                python_profiler.dump_stats(cprofile_path)
+            else:
+                engine.run_in_foreground(BENCHMARK_MESSAGE)
+        wall = time.perf_counter() - started
+        cpu_python = time.process_time() - cpu_before
+        chrome_cpu_after, chrome_rss = tree_usage(chrome_pid)
+
+        pacing = clock.slept if real_pacing else 0.0
+        tool_time = wall - pacing
+        total_cards = cards * pages
+        sent = len(server.messages)
+        meter = engine.navigation_meter
+        return {
+            "cards_per_page": cards,
+            "pages": pages,
+            "messages_sent": sent,
+            "wall_s": round(wall, 3),
+            "pacing_s": round(clock.slept, 3),
+            "pacing_mode": "real" if real_pacing else "stubbed",
+            "lean": lean,
+            "tool_s": round(tool_time, 3),
+            "tool_s_per_card": round(tool_time / total_cards, 4),
+            "cpu_python_s": round(cpu_python, 3),
+            "cpu_chrome_s": round(chrome_cpu_after - chrome_cpu_before, 3),
+            "round_trips": profiler.total,
+            "round_trips_per_card": round(profiler.total / total_cards, 1),
+            "webdriver_s": round(profiler.total_seconds, 3),
+            "rss_python_peak_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            "rss_chrome_mb": round(chrome_rss, 1),
+            "rss_chrome_peak_mb": round(max(sampler.peak_mb, chrome_rss), 1),
+            "navigations": meter.navigations,
+            "kb_per_navigation": round(meter.total_bytes / 1024 / max(meter.navigations, 1), 1),
+            "load_s_per_navigation": round(meter.total_seconds / max(meter.navigations, 1), 3),
+            "requests_blocked": meter.total_blocked,
+            "browser_recycles": engine.memory_guard.recycles,
+            "top_commands": dict(list(profiler.report()["commands"].items())[:8]),
+        }
+    finally:
+        engine.close()
+        log_sink.close()
+        os.chdir(previous_dir)
+        server.shutdown()
+
+
+def compare(results, baseline_path):
+    """Print per-scenario changes against a previous results file"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {r["cards_per_page"]: r for r in json.load(f)["results"]}
+    for result in results:
+        base = baseline.get(result["cards_per_page"])
+        if not base:
+            continue
+        print(f"{result['cards_per_page']} cards/page vs baseline:")
+        for key in ("tool_s_per_card", "round_trips_per_card", "cpu_python_s", "cpu_chrome_s", "rss_chrome_peak_mb",
+                    "kb_per_navigation", "load_s_per_navigation"):
+            old, new = base.get(key), result.get(key)
+            if old:
+                print(f"  {key}: {old} -> {new} ({(new - old) / old * 100:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the bot against the offline fixture site")
+    parser.add_argument("--cards", type=int, nargs="+", default=[20, 200, 2000], help="cards per page")
+    parser.add_argument("--pages", type=int, default=1, help="pages per scenario")
+    parser.add_argument("--pacing", choices=["stub", "real"], default="stub",
+                        help="stub out the bot's sleeps, or sleep and subtract them")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="previous results file to compare against")
+    parser.add_argument("--cprofile", metavar="PREFIX",
+                        help="profile the engine with cProfile and write PREFIX_<cards>.pstats per scenario")
+    parser.add_argument("--lean", action="store_true", help="run Chrome in lean mode (blocked images and analytics)")
+    args = parser.parse_args()
+
+    results = []
+    for cards in args.cards:
+        print(f"Running {cards} cards x {args.pages} page(s)...")
+        cprofile_path = os.path.abspath(f"{args.cprofile}_{cards}.pstats") if args.cprofile else None
+        result = run_scenario(cards, args.pages, args.pacing == "real", cprofile_path, args.lean)
+        print(f"  {result['tool_s_per_card']}s/card, {result['round_trips_per_card']} round-trips/card, "
+              f"{result['messages_sent']} sent")
+        if cprofile_path:
+            print(f"  cProfile stats written to {cprofile_path}")
+        results.append(result)
+
+    output = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2)
+    print(f"Results written to {args.output}")
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1653 @@
+"""
+GUI-free automation engine for CoFoundersLab messaging
+
+MessagingEngine drives Chrome and reports everything it does as events to
+the sinks registered with subscribe(). A sink is any callable taking the
+event name and its arguments:
+
+    log(message)                 one activity log line
+    status(text)                 short status text
+    timings(line)                per-phase timing summary
+    running()                    a run has started
+    stopping()                   Stop was requested
+    finished(start_text)         the worker went idle; "Continue" after a stop
+    site_opened()                Chrome is up on the start page
+    site_failed()                Chrome could not be opened in the background
+    dialog(level, title, text)   something the user should acknowledge
+
+Sinks are called on whichever thread raised the event, so GUI sinks must
+hand the work over to their own main loop.
+"""
+import threading
+import time
+import re
+import os
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import (TimeoutException, WebDriverException, NoSuchElementException,
+                                        StaleElementReferenceException)
+from contact_store import ContactStore, normalize_profile_key, name_key
+from progress_journal import ProgressJournal
+from phase_timer import PhaseTimer, timed_phase
+from webdriver_profiler import WebDriverProfiler
+from selector_registry import SelectorRegistry
+from text_selectors import compile_selector, compile_selectors, find_by_text, text_match_xpath
+from failure_policy import NEUTRAL_OUTCOMES, FailureBreaker
+from pacing import PacingPolicy, detect_throttle, load_pacing_settings
+from browser_profile import ProfileLock, profile_path
+from lean_mode import NavigationMeter, load_lean_settings
+from memory_guard import MemoryGuard
+from dom_waits import SCRIPT_TIMEOUT, condition, wait_for_any, wait_for_dom_quiet
+
+# Builds one record per message button in a single round-trip. Each button's
+# card is the highest ancestor that contains no other message button; the
+# record carries the button handle, the display name and the profile link.
+# With a single button on the page every ancestor qualifies, so the climb
+# never passes <body> or <main> and then settles on the outermost card-like
+# ancestor, or a few levels above the button when there is none.
+CARD_SNAPSHOT_SCRIPT = """
+var buttons = arguments[0];
+var cardSelector = "[data-testid*='card'], [class*='card'], [class*='Card'], article, li";
+var maxDepth = 12, fallbackDepth = 4;
+var counts = new Map();
+buttons.forEach(function (button) {
+    for (var node = button; node; node = node.parentElement) {
+        counts.set(node, (counts.get(node) || 0) + 1);
+    }
+});
+var profileSelector = "a[href*='/profile'], a[href*='/user'], a[href*='/u/'], a[href*='/members/']";
+function cardOf(button) {
+    var path = [button];
+    var card = button, parent = button.parentElement;
+    while (parent && path.length < maxDepth && counts.get(parent) === 1 &&
+           parent !== document.body && parent !== document.documentElement && !parent.matches("main, [role='main']")) {
+        card = parent;
+        path.push(card);
+        parent = card.parentElement;
+    }
+    if (parent && counts.get(parent) > 1) {
+        return card;  // The parent holds other cards too: a real card boundary
+    }
+    for (var i = path.length - 1; i > 0; i--) {
+        if (path[i].matches(cardSelector)) { return path[i]; }
+    }
+    return path[Math.min(fallbackDepth, path.length - 1)];
+}
+return buttons.map(function (button) {
+    var card = cardOf(button);
+    var name = null;
+    var nameElement = card.querySelector('div.flex.items-center p');
+    if (nameElement && nameElement.textContent.trim()) {
+        name = nameElement.textContent.trim();
+    } else {
+        var paragraphs = card.querySelectorAll('p');
+        for (var i = 0; i < paragraphs.length; i++) {
+            if (paragraphs[i].textContent.trim()) {
+                name = paragraphs[i].textContent.trim();
+                break;
+            }
+        }
+    }
+    var profile = null;
+    var idHolder = card.querySelector('[data-user-id], [data-profile-id]') ||
+        (card.matches('[data-user-id], [data-profile-id]') ? card : null);
+    if (idHolder) {
+        profile = 'id:' + (idHolder.dataset.userId || idHolder.dataset.profileId);
+    } else {
+        var link = card.querySelector(profileSelector);
+        if (link) {
+            profile = link.href;
+        }
+    }
+    return {button: button, name: name, profile: profile};
+});
+"""
+
+# Finds the Message button of one card again after a re-render made the
+# snapshot handle stale: by profile id or link first, then by exact name.
+# Clicks it in the same call and returns it, or null when the card is gone.
+RESOLVE_CARD_BUTTON_SCRIPT = """
+var locator = arguments[0], name = arguments[1];
+function messageButton(card) {
+    var controls = card.querySelectorAll('button, a, [data-testid]');
+    for (var i = 0; i < controls.length; i++) {
+        var label = (controls[i].innerText || '') + ' ' + String(controls[i].className || '') + ' ' +
+            (controls[i].getAttribute('data-testid') || '');
+        if (/message/i.test(label)) { return controls[i]; }
+    }
+    return null;
+}
+function buttonFor(anchor) {
+    for (var node = anchor; node; node = node.parentElement) {
+        var button = messageButton(node);
+        if (button) { return button; }
+    }
+    return null;
+}
+var anchor = null;
+if (locator && locator.indexOf('id:') === 0) {
+    var id = CSS.escape(locator.slice(3));
+    anchor = document.querySelector('[data-user-id="' + id + '"], [data-profile-id="' + id + '"]');
+} else if (locator) {
+    var links = document.querySelectorAll('a[href]');
+    for (var i = 0; i < links.length && !anchor; i++) {
+        if (links[i].href === locator) { anchor = links[i]; }
+    }
+}
+if (!anchor && name) {
+    var matches = Array.from(document.querySelectorAll('p')).filter(function (p) {
+        return p.textContent.trim() === name;
+    });
+    if (matches.length === 1) { anchor = matches[0]; }
+}
+var button = anchor && buttonFor(anchor);
+if (button) { button.click(); }
+return button || null;
+"""
+
+# Reads what the bot needs to know about a results page in one call: the
+# total page count from the page's data payload, whether the pagination
+# offers a next page (true, false or null when it cannot tell), the profile
+# links or ids on the page and the number of Message buttons.
+PAGE_INFO_SCRIPT = """
+function findTotal(value, depth) {
+    if (!value || typeof value !== 'object' || depth > 6) { return null; }
+    var keys = ['totalPages', 'pageCount', 'lastPage', 'total_pages', 'page_count'];
+    for (var i = 0; i < keys.length; i++) {
+        if (typeof value[keys[i]] === 'number' && value[keys[i]] > 0) { return value[keys[i]]; }
+    }
+    for (var key in value) {
+        var found = findTotal(value[key], depth + 1);
+        if (found) { return found; }
+    }
+    return null;
+}
+var info = {totalPages: null, hasNext: null, profiles: [], buttons: 0};
+info.totalPages = findTotal(window.__SEARCH__, 0) || findTotal(window.__NEXT_DATA__ && window.__NEXT_DATA__.props, 0);
+var nav = document.querySelector("nav[aria-label*='agination'], [class*='pagination']");
+if (nav) {
+    var controls = nav.querySelectorAll('a, button, span');
+    for (var i = 0; i < controls.length; i++) {
+        var control = controls[i];
+        var label = (control.getAttribute('aria-label') || control.innerText || '').trim();
+        if (control.rel !== 'next' && !/^(next|next page|\u203a|\u00bb|>)$/i.test(label)) { continue; }
+        var disabled = control.disabled || control.getAttribute('aria-disabled') === 'true' ||
+            /disabled/.test(String(control.className || '')) || (control.tagName === 'A' && !control.href) ||
+            control.tagName === 'SPAN';
+        info.hasNext = !disabled;
+        break;
+    }
+}
+var seen = {};
+document.querySelectorAll("[data-user-id], [data-profile-id], a[href*='/profile'], a[href*='/user'], a[href*='/u/'], a[href*='/members/']").forEach(function (node) {
+    var id = node.dataset.userId || node.dataset.profileId;
+    var key = id ? 'id:' + id : node.href;
+    if (key && !seen[key]) { seen[key] = true; info.profiles.push(key); }
+});
+document.querySelectorAll('button').forEach(function (button) {
+    if (/message/i.test(button.innerText || '') || /message/i.test(String(button.className || ''))) { info.buttons += 1; }
+});
+return info;
+"""
+
+# Describes the buttons of a modal in one round-trip for diagnostics
+MODAL_BUTTONS_SCRIPT = """
+return Array.from(arguments[0].querySelectorAll('button')).map(function (button) {
+    return [button.innerText.trim(), String(button.className || '').slice(0, 50)];
+});
+"""
+
+# Selector strategies per UI element; the registry tries the last winner first.
+# ":contains()" is jQuery syntax, so those entries are compiled to XPath.
+MESSAGE_BUTTON_SELECTORS = compile_selectors([
+    "button:contains('Message')",
+    "button span:contains('Message')",
+    "button span.inline-block:contains('Message')",
+    "button:has(svg) span:contains('Message')",
+    "button[class*='inline-flex'] span:contains('Message')",
+    "button[class*='items-center'] span:contains('Message')",
+    "button[class*='justify-center'] span:contains('Message')",
+    "button[class*='rounded'] span:contains('Message')",
+    "button[class*='border'] span:contains('Message')",
+    "button[class*='message']",
+    "button[class*='Message']",
+    "a[class*='message']",
+    "a[class*='Message']",
+    "a:contains('Message')",
+    "[data-testid*='message']",
+    "[class*='btn'][class*='message']"
+])
+
+MESSAGE_INPUT_SELECTORS = [
+    "textarea",
+    "input[type='text']",
+    "input[type='textarea']",
+    "[class*='message'] input",
+    "[class*='Message'] input",
+    "[class*='message'] textarea",
+    "[class*='Message'] textarea"
+]
+
+SEND_BUTTON_SELECTORS = compile_selectors([
+    # Specific CoFoundersLab send button selector
+    "#headlessui-dialog-\\:ri\\: > div > form > div.mt-6.grid.grid-flow-row-dense.grid-cols-2.gap-3 > button.inline-flex.items-center.justify-center.gap-2.border.border-transparent.disabled\\:opacity-50.bg-primary.text-primary-content.hover\\:bg-primary-hover.hover\\:text-primary-content.disabled\\:hover\\:bg-primary.px-4.py-2.rounded-md.sm\\:col-start-2",
+    # Simplified versions of the above
+    "button.inline-flex.items-center.justify-center.gap-2.border.border-transparent.bg-primary.text-primary-content.px-4.py-2.rounded-md.sm\\:col-start-2",
+    "button.bg-primary.text-primary-content.rounded-md.sm\\:col-start-2",
+    "button.sm\\:col-start-2",
+    # Generic selectors
+    "button:contains('Send')",
+    "button span:contains('Send')",
+    "button span.inline-block:contains('Send')",
+    "button[type='submit']",
+    "button[type='submit'] span:contains('Send')",
+    "button[class*='inline-flex'] span:contains('Send')",
+    "button[class*='items-center'] span:contains('Send')",
+    "button[class*='justify-center'] span:contains('Send')",
+    "button[class*='border'] span:contains('Send')",
+    "button[class*='bg-primary'] span:contains('Send')",
+    "button[class*='rounded-md'] span:contains('Send')",
+    "button[class*='send']",
+    "button[class*='Send']",
+    "[class*='btn'][class*='send']",
+    "input[type='submit']"
+])
+
+# Elements whose presence means the search page or dialog has rendered
+PAGE_READY_SELECTOR = "button, [class*='card'], [class*='user']"
+MESSAGE_BUTTONS_READY_SELECTOR = "[class*='message'], [class*='Message'], button"
+MODAL_READY_SELECTOR = "[role='dialog'] textarea, [role='dialog'] input[type='text'], [class*='modal'] textarea"
+MODAL_SELECTOR = "[class*='modal'], [class*='Modal'], [role='dialog']"
+LOADING_SELECTOR = "[class*='loading'], [class*='spinner']"
+EMPTY_RESULTS_SELECTOR = "[class*='empty-state'], [class*='no-results'], [class*='noResults'], [data-testid*='empty']"
+EMPTY_RESULTS_TEXT = compile_selector("p:contains('No results')")
+# Any Message button, matched like the fallback of find_message_buttons (text or class, any case)
+MESSAGE_BUTTON_XPATH = (By.XPATH, text_match_xpath("button", "message", include_class=True))
+
+class MessagingEngine:
+    """Messaging automation without any GUI; see the module docstring for its events"""
+    
+    def __init__(self, start_url=None, headless=None):
+        self.sinks = []  # Event subscribers, see the module docstring
+        
+        # Bot state
+        self.driver = None
+        self.is_running = False
+        self.is_paused = False
+        self.stop_event = threading.Event()  # Set by Stop; every sleep and wait returns early on it
+        self.driver_lock = threading.Lock()  # Held by the worker for as long as it drives the browser
+        self.worker_thread = None
+        self.stop_requested = None  # perf_counter timestamp of the last Stop press
+        self.current_page = 1
+        self.total_pages = None  # Page count read from the first results page, if it has one
+        self.has_next_page = None  # Whether the current page's pagination offers a next page
+        self.message_text = ""
+        self.contacts_file = "messaged_contacts.log"  # Persistent dedup index
+        self.messaged_users = ContactStore(self.contacts_file)  # Track messaged users to prevent duplicates
+        self.currently_messaging = set()  # Track users currently being messaged
+        self.current_user_key = None  # Stable key of the user being messaged
+        self.resume_position = None  # (page, last processed card) to continue from
+        self.resume_started = None  # perf_counter timestamp of the last resume
+        self.phase_timer = PhaseTimer()  # Per-phase latency histograms
+        self.webdriver_profiler = None  # Optional WebDriver round-trip profiler
+        self.selector_registry = SelectorRegistry("selector_stats.json")  # Learned selector order
+        self.progress_file = "bot_progress.journal"  # Append-only progress journal
+        self.legacy_progress_file = "bot_progress.txt"  # Progress file of older versions
+        self.progress_journal = ProgressJournal(self.progress_file)
+        self.progress_journal.load()
+        # Overridable so the bot can run against the offline fixture site
+        self.start_url = start_url or os.environ.get("COFOUNDERSLAB_START_URL", "https://cofounderslab.com/")
+        self.headless = headless if headless is not None else os.environ.get("COFOUNDERSLAB_HEADLESS") == "1"
+        self.profile_webdriver = False  # Install the WebDriver profiler on the next run
+        # Named Chrome profile kept between launches (cache and login survive); None for a fresh one
+        self.browser_profile = os.environ.get("COFOUNDERSLAB_PROFILE") or None
+        self.profile_lock = None
+        # Lean mode blocks images, fonts and analytics through DevTools (lean_mode.json)
+        self.lean_mode = os.environ.get("COFOUNDERSLAB_LEAN") == "1"
+        self.lean_settings_file = "lean_mode.json"
+        self.meter_navigations = False  # Meter navigation traffic even without lean mode
+        self.navigation_meter = None
+        self.navigation_started = None
+        # Renderer memory grows over long runs; recycle the tab (or Chrome) between pages past these limits
+        self.memory_guard = MemoryGuard(heap_limit_mb=512, rss_limit_mb=1024, page_limit=200)
+        self.recycle_driver = False  # Restart Chrome instead of the tab; needs a persistent profile
+        
+        # Waits resolve once the DOM has been quiet for this long, bounded by a hard timeout
+        self.page_quiet_ms = 600  # Quiet window for the card list
+        self.modal_quiet_ms = 300  # Quiet window for the message dialog
+        self.page_load_timeout = 30  # Hard timeout for page and card list waits
+        self.modal_load_timeout = 10  # Hard timeout for the dialog to settle
+        # All deliberate delays, send ceilings and backoff live in the pacing policy
+        self.pacing = PacingPolicy(load_pacing_settings("pacing.json"), sleep=self.stop_event.wait)
+        # Halts the run after this many consecutive failures of the same kind
+        self.failure_breaker = FailureBreaker(threshold=5, card_retries=1)
+        
+    def subscribe(self, sink):
+        """Register a callable that receives every event as sink(event, *args)"""
+        self.sinks.append(sink)
+        
+    def emit(self, event, *args):
+        """Send an event to every subscribed sink"""
+        for sink in self.sinks:
+            sink(event, *args)
+        
+    def log_message(self, message):
+        """Emit one activity log line"""
+        self.emit("log", message)
+        
+    def update_status(self, status):
+        """Emit a status text update"""
+        self.emit("status", status)
+        
+    def save_progress(self, url, page_number, messaged_count):
+        """Append a page transition to the progress journal"""
+        try:
+            self.progress_journal.record_page(url, page_number, messaged_count)
+            self.log_message(f"Progress saved: Page {page_number}, {len(self.messaged_users)} total users messaged")
+            
+        except Exception as e:
+            self.log_message(f"Error saving progress: {str(e)}")
+        
+    def saved_progress(self):
+        """Summary of the saved progress, {} if it cannot be parsed or None if there is none"""
+        if os.path.exists(self.progress_file):
+            state = self.progress_journal.load()
+            return {k: state[k] for k in ("url", "page", "total_messaged", "card") if state.get(k) is not None}
+        if os.path.exists(self.legacy_progress_file):
+            return self.load_legacy_progress()
+        return None
+        
+    def load_legacy_progress(self):
+        """Read progress written by older versions to bot_progress.txt"""
+        progress_info = {}
+        with open(self.legacy_progress_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith("Last URL:"):
+                    progress_info['url'] = line.split(":", 1)[1].strip()
+                elif line.startswith("Page Number:"):
+                    progress_info['page'] = int(line.split(":", 1)[1].strip())
+                elif line.startswith("Total Users Messaged:"):
+                    progress_info['total_messaged'] = int(line.split(":", 1)[1].strip())
+        return progress_info
+        
+    def open_site(self):
+        """Open CoFoundersLab website"""
+        if not self.driver_lock.acquire(blocking=False):
+            self.log_message("The browser is still busy with the previous run, try again in a moment")
+            return False
+        try:
+            return self.launch_site()
+        finally:
+            self.driver_lock.release()
+        
+    def open_site_in_background(self):
+        """Open the website on the worker thread so the caller's event loop keeps running"""
+        if self.worker_busy():
+            return False
+        def launch():
+            if not self.launch_site():
+                self.emit("site_failed")
+        self.start_worker(launch)
+        return True
+        
+    def launch_site(self):
+        """Start Chrome and load the start page"""
+        launch_started = time.perf_counter()
+        try:
+            self.log_message("Opening CoFoundersLab website...")
+            self.update_status("Opening website...")
+            
+            # A previous attempt may have left Chrome running on the profile
+            if self.driver:
+                self.log_message("Closing the browser left open by the previous attempt...")
+                try:
+                    self.driver.quit()
+                except WebDriverException:
+                    pass
+                self.driver = None
+            if not self.browser_profile:
+                self.release_browser_profile()
+            
+            if self.browser_profile:
+                profile_dir = profile_path(self.browser_profile)
+                if not self.claim_browser_profile(profile_dir):
+                    return False
+                self.log_message(f"Using persistent browser profile '{self.browser_profile}' ({profile_dir})")
+            self.navigation_meter = None
+            if self.lean_mode or self.meter_navigations:
+                lean_settings = load_lean_settings(self.lean_settings_file)
+                self.navigation_meter = NavigationMeter(None, lean_settings, blocking=self.lean_mode)
+                if self.lean_mode:
+                    self.log_message(f"Lean mode on: blocking {len(lean_settings['blocked_urls'])} URL patterns "
+                                     f"(images, fonts, media, analytics)")
+            
+            self.start_chrome()
+            chrome_started = time.perf_counter()
+            
+            # Navigate to CoFoundersLab
+            self.log_message("Opening CoFoundersLab website...")
+            self.load_url(self.start_url)
+            
+            # Wait for initial page load
+            self.log_message("Waiting for CoFoundersLab to load...")
+            self.wait_for_page_load()
+            
+            # Verify page opened successfully
+            self.log_message("Verifying page opened successfully...")
+            try:
+                # Check if we're on the correct page
+                current_url = self.driver.current_url
+                if "cofounderslab.com" in current_url or current_url.startswith(self.start_url):
+                    self.log_message("Page verification successful - on CoFoundersLab")
+                else:
+                    self.log_message(f"Warning: Unexpected URL: {current_url}")
+                
+                # Check for key elements
+                matched, _ = wait_for_any(self.driver, [
+                    condition("login", "present", "button, [class*='login'], [class*='sign']"),
+                    condition("search", "present", "[class*='search'], [class*='profile']"),
+                ], 10, cancel=self.stop_event)
+                if matched:
+                    self.log_message("Key page elements detected")
+                else:
+                    self.log_message("Warning: Key page elements not detected, but continuing...")
+            except WebDriverException:
+                self.log_message("Warning: Key page elements not detected, but continuing...")
+            
+            self.log_message("Website opened successfully!")
+            ready = time.perf_counter()
+            profile_kind = f"persistent profile '{self.browser_profile}'" if self.browser_profile else "fresh profile"
+            self.log_message(f"Time to ready: {ready - launch_started:.1f}s (Chrome start "
+                             f"{chrome_started - launch_started:.1f}s, start page {ready - chrome_started:.1f}s, "
+                             f"{profile_kind})")
+            self.update_status("Website opened - Please login and navigate to target page")
+            self.emit("site_opened")
+            # Reset pause state and in-flight tracking when opening new site;
+            # the messaged users index is persistent and survives restarts
+            self.is_paused = False
+            self.currently_messaging.clear()
+            self.log_message(f"Reset messaging tracking ({len(self.messaged_users)} users already messaged)")
+            return True
+            
+        except (WebDriverException, OSError, ValueError) as e:
+            self.log_message(f"Error opening website: {str(e)}")
+            self.emit("dialog", "error", "Error", f"Failed to open website: {str(e)}")
+            if not self.driver:
+                self.release_browser_profile()
+            return False
+        
+    def start_chrome(self):
+        """Start Chrome with the bot's options and prepare its tab"""
+        chrome_options = Options()
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument("--disable-web-security")
+        chrome_options.add_argument("--allow-running-insecure-content")
+        if self.headless:
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--window-size=1280,1024")
+        if self.profile_lock:
+            chrome_options.add_argument(f"--user-data-dir={os.path.dirname(self.profile_lock.path)}")
+        if self.navigation_meter:
+            NavigationMeter.chrome_logging_options(chrome_options)
+        
+        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver.set_script_timeout(SCRIPT_TIMEOUT)
+        if self.navigation_meter:
+            self.navigation_meter.driver = self.driver
+        if self.webdriver_profiler:
+            self.webdriver_profiler.attach(self.driver)
+        self.memory_guard.pages = 0
+        self.prepare_tab()
+        
+    def prepare_tab(self):
+        """Hide the automation flag and install the block list in the current tab"""
+        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if self.navigation_meter:
+            self.navigation_meter.install()
+        
+    def check_memory(self):
+        """Sample the browser's memory at a page boundary; return a reason to recycle it, or None"""
+        try:
+            service = getattr(self.driver, "service", None)
+            root_pid = service.process.pid if service and service.process else None
+            sample = self.memory_guard.sample(self.driver, root_pid)
+        except WebDriverException as e:
+            self.log_message(f"Could not sample browser memory: {str(e)}")
+            return None
+        self.log_message(f"Browser memory after page {self.current_page}: {self.memory_guard.describe(sample)}")
+        return self.memory_guard.check(sample)
+        
+    def recycle_browser(self, url, reason):
+        """Swap in a fresh tab (or a fresh Chrome on a persistent profile) and load url there"""
+        # The dedup store, the journal and the page counters live in the engine, so only the browser changes
+        self.log_message(f"Recycling the browser before page {self.current_page + 1}: {reason}")
+        started = time.perf_counter()
+        if self.recycle_driver and self.profile_lock:
+            self.driver.quit()
+            self.driver = None
+            self.start_chrome()
+            what = "Chrome restarted"
+        else:
+            if self.recycle_driver:
+                self.log_message("Restarting Chrome needs a persistent browser profile to keep the login, "
+                                 "recycling the tab instead")
+            old_tab = self.driver.current_window_handle
+            self.driver.switch_to.new_window("tab")
+            new_tab = self.driver.current_window_handle
+            self.driver.switch_to.window(old_tab)
+            self.driver.close()
+            self.driver.switch_to.window(new_tab)
+            self.prepare_tab()
+            what = "Tab replaced"
+        self.memory_guard.recycled()
+        self.log_message(f"{what} in {time.perf_counter() - started:.1f}s "
+                         f"(recycle {self.memory_guard.recycles} of this session)")
+        self.load_url(url)
+        
+    def claim_browser_profile(self, profile_dir):
+        """Lock the persistent profile so a second instance cannot share it"""
+        if self.profile_lock and self.profile_lock.held:
+            if os.path.dirname(self.profile_lock.path) == profile_dir:
+                return True  # Already ours from an earlier attempt
+            self.release_browser_profile()
+        self.profile_lock = ProfileLock(profile_dir)
+        if self.profile_lock.acquire():
+            return True
+        owner = self.profile_lock.owner() or {}
+        lock_path = self.profile_lock.path
+        self.profile_lock = None
+        text = (f"Browser profile '{self.browser_profile}' is in use by another bot instance "
+                f"(pid {owner.get('pid', '?')}, since {owner.get('since', '?')}). "
+                f"Close it or choose another profile name. If no other instance is running, "
+                f"delete {lock_path}.")
+        self.log_message(text)
+        self.update_status("Browser profile in use")
+        self.emit("dialog", "error", "Profile In Use", text)
+        return False
+        
+    def release_browser_profile(self):
+        """Let other instances use the persistent profile again"""
+        if self.profile_lock:
+            self.profile_lock.release()
+            self.profile_lock = None
+        
+    def start(self, message_text):
+        """Start or continue the messaging automation on a worker thread"""
+        if self.worker_busy():
+            return False
+        if not self.driver:
+            self.emit("dialog", "warning", "Warning", "Please open the website first!")
+            return False
+        self.message_text = message_text
+            
+        # Resume or start automation
+        if self.is_paused:
+            self.log_message("Resuming automation...")
+        else:
+            self.log_message("Starting automation...")
+        self.is_running = True
+        self.is_paused = False
+        self.emit("running")
+        
+        # Start automation thread
+        self.prepare_run()
+        self.start_worker(self.automation_loop)
+        return True
+        
+    def resume(self, message_text):
+        """Restore saved progress and continue messaging from the saved page"""
+        if self.worker_busy():
+            return False
+        if not self.driver:
+            self.emit("dialog", "warning", "Warning", "Please open the website first!")
+            return False
+        self.message_text = message_text
+            
+        self.resume_started = time.perf_counter()
+        state = self.progress_journal.load()
+        if not state.get("url") and os.path.exists(self.legacy_progress_file):
+            state = self.load_legacy_progress()
+        if not state.get("url"):
+            self.resume_started = None
+            self.log_message("No saved progress to resume from")
+            self.emit("dialog", "info", "No Progress", "No saved progress to resume from.")
+            return False
+            
+        self.messaged_users.load()
+        card = state.get("card")
+        self.resume_position = (state.get("page"), card) if card is not None else None
+        self.log_message(f"Resuming from page {state.get('page', 'unknown')} "
+                         f"({len(self.messaged_users)} users already messaged)")
+        
+        self.is_running = True
+        self.is_paused = False
+        self.emit("running")
+        
+        self.prepare_run()
+        self.start_worker(self.resume_loop, state["url"])
+        return True
+        
+    def run_in_foreground(self, message_text):
+        """Run the automation on the calling thread until it finishes
+
+        For harnesses such as the benchmark, which want the engine in-process
+        and on one thread so a profiler sees all of it.
+        """
+        if not self.driver:
+            raise RuntimeError("open_site() must succeed before running the automation")
+        self.message_text = message_text
+        self.is_running = True
+        self.is_paused = False
+        self.emit("running")
+        self.prepare_run()
+        with self.driver_lock:
+            self.automation_loop()
+        
+    def resume_loop(self, url):
+        """Navigate straight to the saved page and run the automation loop"""
+        try:
+            self.update_status("Resuming saved progress...")
+            self.log_message(f"Navigating directly to {url}")
+            self.load_url(url)
+            self.wait_for_page_load()
+            self.log_message(f"Saved page loaded {time.perf_counter() - self.resume_started:.1f}s after resume")
+        except WebDriverException as e:
+            self.log_message(f"Error navigating to saved page: {str(e)}")
+        self.automation_loop()
+        
+    def prepare_run(self):
+        """Reset per-run instrumentation and pacing counters before starting the worker"""
+        self.stop_event.clear()
+        self.failure_breaker.reset()
+        self.total_pages = None
+        self.has_next_page = None
+        self.phase_timer.reset()
+        self.setup_webdriver_profiler()
+        state = self.progress_journal.state
+        self.pacing.start_session(state.get("sent_today", 0), state.get("day"))
+        
+    def stop(self):
+        """Stop the messaging automation"""
+        self.stop_requested = time.perf_counter()
+        self.is_running = False
+        self.is_paused = True
+        # Wakes the worker out of any pacing sleep or browser-side wait; the
+        # worker closes open modals itself so only one thread drives Chrome
+        self.stop_event.set()
+        self.emit("stopping")
+        self.update_status("Stopping...")
+        self.log_message("Stop requested - interrupting the current step...")
+        
+    def start_worker(self, target, *args):
+        """Run target on the automation thread while it holds the driver lock"""
+        def run():
+            with self.driver_lock:
+                target(*args)
+        self.worker_thread = threading.Thread(target=run, daemon=True)
+        self.worker_thread.start()
+        
+    def worker_busy(self):
+        """True while the previous automation thread is still winding down"""
+        if self.worker_thread and self.worker_thread.is_alive():
+            self.log_message("The previous run is still stopping, try again in a moment")
+            return True
+        return False
+        
+    def close_open_modals(self):
+        """Dismiss any dialog left open when the automation was stopped"""
+        try:
+            # Press Escape key to close any open modals
+            from selenium.webdriver.common.keys import Keys
+            self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+        except WebDriverException:
+            pass
+        try:
+            # Try to click outside any modal to close it
+            self.driver.execute_script("document.body.click();")
+        except WebDriverException:
+            pass
+        
+    def automation_loop(self):
+        """Main automation loop"""
+        try:
+            if self.is_paused:
+                self.log_message("Resuming automation from where it left off...")
+                self.update_status("Resuming automation...")
+            else:
+                self.log_message("Starting automation...")
+                self.update_status("Running automation...")
+            
+            while self.is_running:
+                # Check if we're on a search page
+                current_url = self.driver.current_url
+                if "search" not in current_url:
+                    self.log_message("Not on search page. Please navigate to the target page first.")
+                    break
+                    
+                # Extract current page number
+                page_match = re.search(r'page=(\d+)', current_url)
+                if page_match:
+                    self.current_page = int(page_match.group(1))
+                else:
+                    self.current_page = 1
+                    
+                self.log_message(f"Processing page {self.current_page}")
+                
+                # Stop right away at the end of the results, and skip pages
+                # whose users were all messaged already without a full card scan
+                page_info = self.read_page_info()
+                if page_info["empty"]:
+                    self.log_message(f"Page {self.current_page} has no results - end of results reached")
+                    break
+                if page_info["all_messaged"]:
+                    self.log_message(f"All {page_info['cards']} users on page {self.current_page} were already messaged, skipping page")
+                    if self.is_running and self.go_to_next_page():
+                        self.wait_for_page_load()
+                        continue
+                    break
+                    
+                if self.webdriver_profiler:
+                    self.webdriver_profiler.start("page")
+                
+                # Find all user cards with message buttons
+                message_buttons = self.find_message_buttons()
+                
+                # If no message buttons found, move to next page
+                if not message_buttons:
+                    self.log_message("No message buttons found on this page")
+                    break
+                    
+                self.log_message(f"Found {len(message_buttons)} users to message")
+                cards = self.snapshot_cards(message_buttons)
+                queued = self.queue_cards(cards)
+                
+                # Send messages to the users left after the pre-filter
+                success_count = 0
+                stale_skipped = 0
+                halted = False
+                for i, card in queued:
+                    # Check stop condition before each user
+                    if not self.is_running:
+                        self.log_message("Stopping automation - stop button clicked")
+                        break
+                        
+                    try:
+                        # Identify the user by their profile link so the key
+                        # survives shifting search results and restarts
+                        button = card["button"]
+                        user_id = card["key"]
+                        
+                        # Catch a user listed twice on the same page
+                        if user_id and user_id in self.messaged_users:
+                            self.log_message(f"User {i+1} already messaged, skipping...")
+                            continue
+                            
+                        # Check if we're currently messaging this user
+                        if user_id in self.currently_messaging:
+                            self.log_message(f"User {i+1} currently being messaged, skipping...")
+                            continue
+                            
+                        # Mark user as currently being messaged
+                        if user_id:
+                            self.currently_messaging.add(user_id)
+                        self.log_message(f"Messaging user {i+1}/{len(message_buttons)}")
+                        
+                        # Check stop condition before sending message
+                        if not self.is_running:
+                            self.log_message("Stopping automation - stop button clicked")
+                            self.currently_messaging.discard(user_id)
+                            break
+                            
+                        # Respect the send ceilings and the gap or backoff before each contact
+                        allowed, reason = self.pacing.can_send()
+                        if not allowed:
+                            self.log_message(f"Stopping automation - {reason}")
+                            self.update_status(f"Stopped: {reason}")
+                            self.currently_messaging.discard(user_id)
+                            self.is_running = False
+                            break
+                        waited = self.pacing.wait_before_contact()
+                        if waited > self.pacing.settings["contact_gap_seconds"] + self.pacing.settings["contact_gap_jitter"]:
+                            self.log_message(f"Waited {waited:.0f}s for backoff before next contact")
+                        if not self.is_running:
+                            self.currently_messaging.discard(user_id)
+                            break
+                            
+                        if self.resume_started is not None:
+                            self.log_message(f"First message attempt {time.perf_counter() - self.resume_started:.1f}s after resume")
+                            self.resume_started = None
+                            
+                        # Try to send message to user, retrying failures that
+                        # happened before the Send button was clicked
+                        if self.webdriver_profiler:
+                            self.webdriver_profiler.start("card")
+                        attempt = 0
+                        while True:
+                            message_sent = self.send_message_to_user(button, user_id, card["name"], card["locator"])
+                            failure = None if message_sent else self.last_failure
+                            if message_sent or not self.is_running or attempt >= self.failure_breaker.retries_for(failure):
+                                break
+                            attempt += 1
+                            self.log_message(f"Retrying user {i+1} after '{failure}' failure (attempt {attempt + 1})")
+                            self.pacing.pause("before_retry")
+                        self.pacing.contact_finished()
+                        if self.webdriver_profiler:
+                            self.log_message(f"WebDriver round-trips for user {i+1}: {self.webdriver_profiler.stop('card')}")
+                        
+                        self.emit("timings", self.phase_timer.status_line())
+                        
+                        # An attempt cut short by Stop is neither a success nor a failure
+                        if not message_sent and not self.is_running:
+                            self.currently_messaging.discard(user_id)
+                            self.log_message(f"Stopped before user {i+1} was messaged")
+                            break
+                        
+                        # Back off when the site shows a rate-limit or error banner
+                        try:
+                            throttle = detect_throttle(self.driver)
+                        except WebDriverException:
+                            throttle = None
+                        if throttle:
+                            # A confirmed send still counts; the banner only slows the run down
+                            if message_sent:
+                                self.pacing.record_result(True)
+                            else:
+                                failure = "throttled"
+                            delay = self.pacing.record_throttle()
+                            self.log_message(f"Site pushed back: '{throttle}' - backing off for {delay:.0f}s")
+                        elif failure not in NEUTRAL_OUTCOMES:
+                            delay = self.pacing.record_result(message_sent)
+                            if delay:
+                                self.log_message(f"Repeated send failures - backing off for {delay:.0f}s")
+                        
+                        if message_sent:
+                            # Mark user as messaged immediately after successful send,
+                            # falling back to the key resolved from the modal
+                            self.failure_breaker.record_success()
+                            self.messaged_users.add(user_id or self.current_user_key)
+                            self.progress_journal.record_send(self.driver.current_url, self.current_page,
+                                                              user_id or self.current_user_key, i)
+                            success_count += 1
+                            self.log_message(f"Successfully messaged user {i+1}")
+                            # Remove from currently messaging
+                            self.currently_messaging.discard(user_id)
+                            
+                            # Check stop condition after each message
+                            if not self.is_running:
+                                self.log_message("Stopping automation - stop button clicked")
+                                break
+                        elif failure in NEUTRAL_OUTCOMES:
+                            if failure == "card_gone":
+                                stale_skipped += 1
+                            self.log_message(f"User {i+1} skipped ({failure})")
+                            self.currently_messaging.discard(user_id)
+                        else:
+                            # Message failed, log and continue to next user
+                            # unless the same failure keeps repeating
+                            self.log_message(f"Failed to message user {i+1} ({failure})")
+                            # Remove from currently messaging
+                            self.currently_messaging.discard(user_id)
+                            contacted_key = user_id or self.current_user_key
+                            if failure == "error_after_send" and contacted_key:
+                                # Send was clicked, so the message most likely went out: never send it twice
+                                self.messaged_users.add(contacted_key)
+                                self.progress_journal.record_send(self.driver.current_url, self.current_page,
+                                                                  contacted_key, i)
+                                self.log_message(f"User {i+1} recorded as contacted since Send was already clicked")
+                            if self.record_card_failure(failure, i):
+                                halted = True
+                                break
+                            
+                    except (TimeoutException, WebDriverException, NoSuchElementException) as e:
+                        self.log_message(f"Error messaging user {i+1}: {str(e)}")
+                        self.currently_messaging.discard(card["key"])
+                        delay = self.pacing.record_result(False)
+                        if delay:
+                            self.log_message(f"Repeated send failures - backing off for {delay:.0f}s")
+                        if self.record_card_failure("webdriver_error", i):
+                            halted = True
+                            break
+                        # Check stop condition after error
+                        if not self.is_running:
+                            self.log_message("Stopping automation - stop button clicked")
+                            break
+                        
+                self.resume_position = None
+                self.log_message(f"Successfully messaged {success_count} users on page {self.current_page}")
+                if stale_skipped:
+                    self.log_message(f"Skipped {stale_skipped} cards that disappeared after a re-render")
+                self.log_message(f"Total users messaged so far: {len(self.messaged_users)}")
+                if halted:
+                    break
+                
+                # Save progress after completing the page
+                current_url = self.driver.current_url
+                self.save_progress(current_url, self.current_page, success_count)
+                if self.webdriver_profiler:
+                    self.log_message(f"WebDriver round-trips for page {self.current_page}: {self.webdriver_profiler.stop('page')}")
+                
+                # Go to next page
+                if self.is_running:
+                    if self.go_to_next_page():
+                        self.log_message(f"Navigated to page {self.current_page + 1}")
+                        self.log_message("Waiting for page to fully load...")
+                        # Wait for page to fully load before continuing
+                        self.wait_for_page_load()
+                    else:
+                        self.log_message("No more pages available")
+                        break
+                        
+        except (TimeoutException, WebDriverException, NoSuchElementException) as e:
+            self.log_message(f"Automation error: {str(e)}")
+            self.update_status("Error occurred")
+            
+        finally:
+            self.progress_journal.sync()
+            self.save_selector_stats()
+            self.export_timings()
+            self.export_webdriver_profile()
+            if self.navigation_meter and self.navigation_meter.summary():
+                self.log_message(f"Navigation traffic since Open Site: {self.navigation_meter.summary()}")
+            # Only reset to start if automation completed naturally (not paused)
+            if not self.is_paused:
+                self.is_running = False
+                self.emit("finished", "Start Messaging")
+                self.update_status("Automation halted - see log" if self.failure_breaker.tripped else "Automation completed")
+            else:
+                # If paused, close what the interrupted step left open and keep
+                # the continue button ready
+                if self.driver:
+                    self.close_open_modals()
+                if self.stop_requested is not None:
+                    self.log_message(f"Automation stopped {time.perf_counter() - self.stop_requested:.1f}s after Stop was pressed")
+                    self.stop_requested = None
+                self.update_status("Paused - Click Continue to resume")
+                self.log_message("Automation paused by user - Click Continue to resume")
+                self.emit("finished", "Continue")
+        
+    def record_card_failure(self, failure, card_index):
+        """Feed a failed card to the circuit breaker and halt the run when it trips"""
+        try:
+            url = self.driver.current_url
+        except WebDriverException:
+            url = None
+        if not self.failure_breaker.record_failure(failure, url, self.current_page, card_index):
+            return False
+        url, page, first_index = self.failure_breaker.first_failure
+        self.log_message(f"Circuit breaker tripped: {self.failure_breaker.diagnostic()}")
+        if url:
+            # Point saved progress at the first failed card so a resume retries it
+            self.progress_journal.record_halt(url, page, first_index)
+            self.log_message(f"Progress left at page {page}, user {first_index + 1} - resume once the cause is fixed")
+        self.is_running = False
+        return True
+        
+    def save_selector_stats(self):
+        """Persist which selectors matched so the next run tries them first"""
+        try:
+            self.selector_registry.save()
+        except OSError as e:
+            self.log_message(f"Error saving selector statistics: {str(e)}")
+        
+    def export_timings(self):
+        """Write the per-phase latency summary of this run to a JSON file"""
+        summary = self.phase_timer.summary()
+        if not summary:
+            return
+        filename = f"timings_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        try:
+            self.phase_timer.export(filename)
+            self.log_message(f"Phase timings exported to {filename}")
+            slowest = sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True)[:5]
+            for phase, stats in slowest:
+                self.log_message(f"  {phase}: n={stats['count']} total={stats['total']:.1f}s "
+                                 f"p50={stats['p50']:.2f}s p95={stats['p95']:.2f}s p99={stats['p99']:.2f}s")
+        except OSError as e:
+            self.log_message(f"Error exporting phase timings: {str(e)}")
+        
+    def setup_webdriver_profiler(self):
+        """Install or remove the WebDriver profiler according to the option"""
+        if self.profile_webdriver:
+            if self.webdriver_profiler is None or self.webdriver_profiler.driver is not self.driver:
+                self.webdriver_profiler = WebDriverProfiler(self.driver)
+                self.log_message("WebDriver profiling enabled")
+        elif self.webdriver_profiler is not None:
+            self.webdriver_profiler.uninstall()
+            self.webdriver_profiler = None
+            self.log_message("WebDriver profiling disabled")
+        
+    def export_webdriver_profile(self):
+        """Write the WebDriver round-trip report of this run to a JSON file"""
+        if not self.webdriver_profiler:
+            return
+        filename = f"webdriver_profile_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        try:
+            self.webdriver_profiler.export(filename)
+            report = self.webdriver_profiler.report(top_sites=5)
+            self.log_message(f"WebDriver profile exported to {filename}: {report['round_trips']} round-trips, "
+                             f"{report['seconds']:.1f}s in WebDriver")
+            for unit, stats in report["per_unit"].items():
+                self.log_message(f"  Round-trips per {unit}: mean {stats['mean']}, max {stats['max']}")
+            for site, count in report["call_sites"].items():
+                self.log_message(f"  {site}: {count}")
+        except OSError as e:
+            self.log_message(f"Error exporting WebDriver profile: {str(e)}")
+        
+    def read_page_info(self):
+        """Wait for user cards or an empty-results marker, then read the pagination state"""
+        info = {"empty": False, "all_messaged": False, "cards": 0}
+        matched, _ = wait_for_any(self.driver, [
+            condition("cards", "present", MESSAGE_BUTTON_XPATH),
+            condition("empty", "present", EMPTY_RESULTS_SELECTOR),
+            condition("empty", "present", EMPTY_RESULTS_TEXT),
+        ], self.page_load_timeout, cancel=self.stop_event)
+        if matched == "empty":
+            info["empty"] = True
+            return info
+        if matched != "cards":
+            # Neither cards nor an empty marker in time: let find_message_buttons decide
+            self.log_message("No Message buttons or empty-results marker detected yet, scanning the page")
+            return info
+        try:
+            data = self.driver.execute_script(PAGE_INFO_SCRIPT)
+        except WebDriverException as e:
+            self.log_message(f"Could not read pagination info: {str(e)}")
+            return info
+        if self.total_pages is None and data.get("totalPages"):
+            self.total_pages = int(data["totalPages"])
+            self.log_message(f"Search results have {self.total_pages} pages")
+        self.has_next_page = data.get("hasNext")
+        keys = [normalize_profile_key(profile) for profile in data.get("profiles", [])]
+        info["cards"] = data.get("buttons", 0)
+        # Only skip when every Message button is accounted for by a known profile
+        info["all_messaged"] = (info["cards"] > 0 and len(keys) >= info["cards"] and
+                                all(key and key in self.messaged_users for key in keys))
+        return info
+        
+    @timed_phase("find_message_buttons")
+    def find_message_buttons(self):
+        """Find all message buttons on the current page"""
+        try:
+            self.log_message(f"Waiting for message buttons to load (max {self.page_load_timeout} seconds)...")
+            
+            # Wait until buttons are present and the dynamic content has stopped changing
+            if self.wait_until_quiet("Message buttons", MESSAGE_BUTTONS_READY_SELECTOR, self.page_quiet_ms,
+                                     self.page_load_timeout, results=MESSAGE_BUTTON_XPATH) == "timeout":
+                return []
+            
+            # Try the selectors for message buttons, last winner first
+            message_buttons, selector = self.selector_registry.find(
+                self.driver, "message_button", MESSAGE_BUTTON_SELECTORS, multiple=True)
+            if message_buttons:
+                self.log_message(f"Found {len(message_buttons)} buttons with selector: {selector}")
+                    
+            # If no specific selectors work, try to find buttons with "message" text
+            if not message_buttons:
+                self.log_message("Trying fallback method to find message buttons...")
+                # One query for buttons whose text (including inner spans) or class mentions "message"
+                message_buttons = find_by_text(self.driver, "button", "message", include_class=True)
+                        
+            self.log_message(f"Total message buttons found: {len(message_buttons)}")
+            return message_buttons
+            
+        except (TimeoutException, WebDriverException) as e:
+            self.log_message(f"Error finding message buttons: {str(e)}")
+            return []
+        
+    def snapshot_cards(self, message_buttons):
+        """Read name and profile link of every user card in one script call"""
+        try:
+            records = self.driver.execute_script(CARD_SNAPSHOT_SCRIPT, message_buttons)
+        except WebDriverException as e:
+            self.log_message(f"Could not snapshot user cards: {str(e)}")
+            records = [{"button": button, "name": None, "profile": None} for button in message_buttons]
+            
+        cards = []
+        for record in records:
+            cards.append({
+                "button": record["button"],
+                "name": record.get("name"),
+                "key": normalize_profile_key(record.get("profile")),
+                "locator": record.get("profile"),
+            })
+        named = sum(1 for card in cards if card["name"])
+        self.log_message(f"Snapshot of {len(cards)} user cards ({named} with names)")
+        return cards
+        
+    def queue_cards(self, cards):
+        """Drop cards before the saved progress point or already in the dedup store
+
+        Returns (index, card) pairs, keeping each card's position on the page
+        for progress records.
+        """
+        resume_card = None
+        if self.resume_position and self.resume_position[0] == self.current_page:
+            resume_card = self.resume_position[1]
+        queued = []
+        already_contacted = 0
+        for i, card in enumerate(cards):
+            if resume_card is not None and i <= resume_card:
+                continue
+            if card["key"] and card["key"] in self.messaged_users:
+                already_contacted += 1
+                continue
+            queued.append((i, card))
+        before_resume = resume_card + 1 if resume_card is not None else 0
+        self.log_message(f"Queued {len(queued)} of {len(cards)} users on page {self.current_page} - "
+                         f"{already_contacted} already contacted"
+                         + (f", {min(before_resume, len(cards))} before the saved progress point" if before_resume else ""))
+        return queued
+        
+    def extract_user_name_from_modal(self, modal):
+        """Extract user name from modal title"""
+        try:
+            self.log_message("Extracting user name from modal title...")
+            
+            # Look for the modal title with user name
+            # <h3 class="text-lg font-semibold leading-6">Send Otwan a message</h3>
+            try:
+                title_element = modal.find_element(By.CSS_SELECTOR, "h3")
+                if title_element and title_element.text.strip():
+                    title_text = title_element.text.strip()
+                    self.log_message(f"Found modal title: {title_text}")
+                    
+                    # Extract name from "Send [Name] a message"
+                    if "Send" in title_text and "a message" in title_text:
+                        # Extract name between "Send" and "a message"
+                        start = title_text.find("Send") + 4  # After "Send"
+                        end = title_text.find("a message")
+                        if start < end:
+                            user_name = title_text[start:end].strip()
+                            if user_name:
+                                self.log_message(f"Extracted user name from modal: {user_name}")
+                                return user_name
+            except:
+                pass
+            
+            # Alternative: look for any h3 with text
+            try:
+                h3_elements = modal.find_elements(By.CSS_SELECTOR, "h3")
+                for h3 in h3_elements:
+                    if h3.text.strip():
+                        title_text = h3.text.strip()
+                        self.log_message(f"Found h3 text: {title_text}")
+                        
+                        # Try to extract name from various patterns
+                        if "Send" in title_text and "message" in title_text:
+                            # Pattern: "Send [Name] a message"
+                            import re
+                            match = re.search(r'Send\s+([^a]+?)\s+a\s+message', title_text)
+                            if match:
+                                user_name = match.group(1).strip()
+                                self.log_message(f"Extracted user name (regex): {user_name}")
+                                return user_name
+            except:
+                pass
+                
+            self.log_message("Could not extract user name from modal")
+            return None
+            
+        except Exception as e:
+            self.log_message(f"Error extracting user name from modal: {str(e)}")
+            return None
+        
+    def send_message_to_user(self, message_button, user_key=None, user_name=None, locator=None):
+        """Send message to a specific user"""
+        self.current_user_key = user_key
+        self.last_failure = None  # Failure kind when this returns False, see failure_policy
+        send_clicked = False
+        laps = self.phase_timer.laps("send_message")
+        try:
+            # Check stop condition before starting
+            if not self.is_running:
+                return False
+                
+            # User name from the card snapshot (will try again from modal if needed)
+            # Create personalized message (will be updated if we find name in modal)
+            if user_name:
+                personalized_message = self.message_text.replace("Hi there", f"Hi {user_name}")
+                if personalized_message == self.message_text:  # If no "Hi there" found, add greeting
+                    personalized_message = f"Hi {user_name},\n\n{self.message_text}"
+                self.log_message(f"Personalized message for {user_name}")
+            else:
+                personalized_message = self.message_text
+                self.log_message("Using original message (no user name found from button)")
+                
+            self.log_message("Attempting to send message to user...")
+                
+            # Click the message button
+            self.log_message("Clicking message button...")
+            try:
+                self.driver.execute_script("arguments[0].click();", message_button)
+            except StaleElementReferenceException:
+                # The card list re-rendered; find this card again with one query
+                self.log_message("Message button went stale, re-resolving the card...")
+                if not self.driver.execute_script(RESOLVE_CARD_BUTTON_SCRIPT, locator, user_name):
+                    self.log_message("Card is no longer on the page")
+                    self.last_failure = "card_gone"
+                    return False
+                self.log_message("Card re-resolved and clicked")
+            self.pacing.pause("after_click")
+            laps.mark("click")
+            
+            # Verify button click was successful by checking if modal appears
+            self.log_message("Verifying message button click was successful...")
+            # Wait for any loading indicators or modal to start appearing
+            matched, modal = wait_for_any(self.driver, [
+                condition("modal", "present", MODAL_SELECTOR),
+                condition("loading", "present", LOADING_SELECTOR),
+            ], 5, cancel=self.stop_event)
+            if matched:
+                self.log_message(f"Message button click verified - {matched} detected")
+            else:
+                self.log_message("Warning: No immediate response to button click, but continuing...")
+            
+            # Check stop condition after clicking
+            if not self.is_running:
+                return False
+            
+            # Wait for modal to appear
+            if matched != "modal":
+                self.log_message("Waiting for message modal to appear (max 30 seconds)...")
+                matched, modal = wait_for_any(self.driver, [condition("modal", "present", MODAL_SELECTOR)], 30, cancel=self.stop_event)
+            laps.mark("modal_detect")
+            if not matched:
+                self.log_message("Modal did not appear within 30 seconds")
+                self.last_failure = "no_modal"
+                return False
+            self.log_message("Modal detected, waiting for it to fully load...")
+            self.wait_until_quiet("Modal", MODAL_READY_SELECTOR, self.modal_quiet_ms,
+                                  self.modal_load_timeout, scope=modal)
+            laps.mark("modal_settle")
+                
+            # Try to extract user name from modal title
+            modal_user_name = self.extract_user_name_from_modal(modal)
+            if modal_user_name and not user_name:
+                user_name = modal_user_name
+                # Update personalized message with modal user name
+                personalized_message = self.message_text.replace("Hi there", f"Hi {user_name}")
+                if personalized_message == self.message_text:  # If no "Hi there" found, add greeting
+                    personalized_message = f"Hi {user_name},\n\n{self.message_text}"
+                self.log_message(f"Found user name in modal: {user_name}")
+            elif modal_user_name and user_name:
+                # Confirm user name matches
+                if modal_user_name.lower().strip() == user_name.lower().strip():
+                    self.log_message(f"User name confirmed from modal: {modal_user_name}")
+                else:
+                    self.log_message(f"User name mismatch! Button: '{user_name}' vs Modal: '{modal_user_name}'")
+                    # Use modal name as it's more reliable
+                    user_name = modal_user_name
+                    personalized_message = self.message_text.replace("Hi there", f"Hi {user_name}")
+                    if personalized_message == self.message_text:
+                        personalized_message = f"Hi {user_name},\n\n{self.message_text}"
+                    self.log_message(f"Using modal user name: {user_name}")
+            elif not modal_user_name and user_name:
+                self.log_message(f"Using user name from button: {user_name}")
+            else:
+                self.log_message("No user name found from either source")
+            
+            # Without a profile link on the card, fall back to the modal name
+            if not self.current_user_key:
+                self.current_user_key = name_key(modal_user_name or user_name)
+                if self.current_user_key in self.messaged_users:
+                    self.log_message(f"{modal_user_name or user_name} was already messaged, closing modal...")
+                    from selenium.webdriver.common.keys import Keys
+                    self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+                    self.last_failure = "duplicate"
+                    return False
+            
+            laps.mark("modal_name")
+            
+            # Find text input in modal
+            self.log_message("Waiting for text input field to be available...")
+            
+            # Wait for text input to be present
+            matched, _ = wait_for_any(self.driver, [
+                condition("textarea", "present", "textarea"),
+                condition("text input", "present", "input[type='text']"),
+                condition("textarea input", "present", "input[type='textarea']"),
+            ], 20, scope=modal, cancel=self.stop_event)
+            if matched:
+                self.log_message("Text input field detected")
+            else:
+                self.log_message("Text input not detected within 20 seconds, but continuing...")
+            
+            text_input, selector = self.selector_registry.find(modal, "message_input", MESSAGE_INPUT_SELECTORS)
+            if text_input:
+                self.log_message(f"Found text input with selector: {selector}")
+                    
+            laps.mark("input_lookup")
+            if not text_input:
+                self.log_message("Could not find text input in modal")
+                self.last_failure = "no_input"
+                return False
+                
+            # Check stop condition before entering message
+            if not self.is_running:
+                return False
+                
+            # Clear and enter personalized message
+            self.log_message("Clearing text input field...")
+            text_input.clear()
+            self.pacing.pause("after_clear")
+            
+            # Verify field was cleared
+            try:
+                field_value = text_input.get_attribute("value")
+                if field_value.strip():
+                    self.log_message("Warning: Text field not fully cleared, trying again...")
+                    text_input.clear()
+                    self.pacing.pause("after_clear_retry")
+            except:
+                pass
+            
+            # Log the personalized message for confirmation
+            self.log_message(f"Sending personalized message to {user_name if user_name else 'unknown user'}")
+            self.log_message(f"Message preview: {personalized_message[:100]}{'...' if len(personalized_message) > 100 else ''}")
+            
+            self.log_message("Typing personalized message...")
+            text_input.send_keys(personalized_message)
+            self.pacing.pause("after_type")
+            
+            # Verify message was entered correctly
+            try:
+                entered_text = text_input.get_attribute("value")
+                if entered_text.strip():
+                    self.log_message("Message entered successfully")
+                else:
+                    self.log_message("Warning: Message may not have been entered correctly")
+            except:
+                self.log_message("Could not verify message entry, but continuing...")
+            
+            laps.mark("clear_type")
+            
+            # Check stop condition after entering message
+            if not self.is_running:
+                return False
+                
+            # Wait a bit more for the send button to become enabled/visible
+            self.pacing.pause("before_send")
+            
+            # Find and click send button
+            self.log_message("Looking for send button after entering message...")
+            self.log_message("Waiting for send button to be available (max 20 seconds)...")
+            
+            # Wait for send button to be present and clickable
+            matched, _ = wait_for_any(self.driver, [
+                condition("send text", "present", compile_selector("button:contains('Send')")),
+                condition("submit", "present", "button[type='submit']"),
+                condition("primary", "present", "button.bg-primary"),
+            ], 20, cancel=self.stop_event)
+            if matched:
+                self.log_message("Send button detected, proceeding...")
+            else:
+                self.log_message("Send button not detected within 20 seconds, but continuing...")
+            
+            send_button, selector = self.selector_registry.find(modal, "send_button", SEND_BUTTON_SELECTORS)
+            if send_button:
+                self.log_message(f"Found send button with selector: {selector}")
+                    
+            # Try finding send button in the entire document (not just modal)
+            if not send_button:
+                self.log_message("Trying to find send button in entire document...")
+                try:
+                    # Try the specific CoFoundersLab selector on the entire document
+                    send_button = self.driver.find_element(By.CSS_SELECTOR, 
+                        "#headlessui-dialog-\\:ri\\: > div > form > div.mt-6.grid.grid-flow-row-dense.grid-cols-2.gap-3 > button.inline-flex.items-center.justify-center.gap-2.border.border-transparent.disabled\\:opacity-50.bg-primary.text-primary-content.hover\\:bg-primary-hover.hover\\:text-primary-content.disabled\\:hover\\:bg-primary.px-4.py-2.rounded-md.sm\\:col-start-2")
+                    if send_button:
+                        self.log_message("Found send button using document-wide selector")
+                except:
+                    pass
+                    
+            # Fallback: search all buttons in modal for "Send" text
+            if not send_button:
+                self.log_message("Trying fallback method to find send button...")
+                # One query for modal buttons whose text (including inner spans) mentions "send"
+                send_buttons = find_by_text(modal, "button", "send")
+                if send_buttons:
+                    send_button = send_buttons[0]
+                    self.log_message("Found send button using fallback method")
+                else:
+                    modal_buttons = self.driver.execute_script(MODAL_BUTTONS_SCRIPT, modal)
+                    self.log_message(f"Found {len(modal_buttons)} buttons in modal")
+                    for i, (button_text, button_class) in enumerate(modal_buttons):
+                        self.log_message(f"Button {i+1}: text='{button_text}', class='{button_class}...'")
+                    
+            laps.mark("send_lookup")
+            if not send_button:
+                self.log_message("Could not find send button")
+                self.last_failure = "no_send_button"
+                return False
+                
+            # Check stop condition before sending
+            if not self.is_running:
+                return False
+                
+            # Check if send button is enabled
+            try:
+                is_enabled = send_button.is_enabled()
+                self.log_message(f"Send button enabled: {is_enabled}")
+                if not is_enabled:
+                    self.log_message("Send button is disabled, waiting...")
+                    self.pacing.pause("send_enable")
+                    is_enabled = send_button.is_enabled()
+                    self.log_message(f"Send button enabled after wait: {is_enabled}")
+            except:
+                self.log_message("Could not check if send button is enabled")
+                
+            # Click send button
+            self.log_message("Clicking send button...")
+            self.driver.execute_script("arguments[0].click();", send_button)
+            send_clicked = True
+            self.pacing.pause("after_send")
+            
+            # Verify send button click was successful
+            self.log_message("Verifying send button click was successful...")
+            # Check if modal starts to close or loading appears
+            matched, _ = wait_for_any(self.driver, [
+                condition("modal closing", "hidden", send_button),
+                condition("loading", "present", "[class*='loading'], [class*='spinner'], [class*='success']"),
+            ], 5, cancel=self.stop_event)
+            if matched:
+                self.log_message(f"Send button click verified - {matched} detected")
+            else:
+                self.log_message("Warning: No immediate response to send button click, but continuing...")
+            
+            laps.mark("send_click")
+            
+            # Check stop condition after sending; the message is already on
+            # its way, so report it as sent and leave the modal to the worker
+            if not self.is_running:
+                return True
+            
+            # Try to close modal or wait for it to disappear
+            self.log_message("Closing message modal...")
+            modal_closed = False
+            
+            try:
+                # Try to find and click cancel button
+                cancel_button = modal.find_element(*compile_selector("button[class*='cancel'], button[class*='Cancel'], button:contains('Cancel')"))
+                self.driver.execute_script("arguments[0].click();", cancel_button)
+                self.pacing.pause("after_close")
+                modal_closed = True
+                self.log_message("Modal closed using cancel button")
+            except (NoSuchElementException, TimeoutException, StaleElementReferenceException):
+                self.log_message("Cancel button not found, trying alternative methods...")
+                
+                # Try pressing Escape key
+                try:
+                    from selenium.webdriver.common.keys import Keys
+                    text_input.send_keys(Keys.ESCAPE)
+                    self.pacing.pause("after_close")
+                    modal_closed = True
+                    self.log_message("Modal closed using Escape key")
+                except:
+                    pass
+                
+                # Try clicking outside modal
+                try:
+                    self.driver.execute_script("document.body.click();")
+                    self.pacing.pause("after_close")
+                    modal_closed = True
+                    self.log_message("Modal closed by clicking outside")
+                except:
+                    pass
+            
+            # Wait for modal to actually disappear
+            if modal_closed:
+                if wait_for_any(self.driver, [condition("closed", "hidden", modal)], 15, cancel=self.stop_event)[0]:
+                    self.log_message("Modal successfully closed and disappeared")
+                else:
+                    self.log_message("Modal still visible after close attempt, trying additional methods...")
+                    # Try additional close methods
+                    try:
+                        from selenium.webdriver.common.keys import Keys
+                        self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
+                        self.pacing.pause("after_close")
+                    except:
+                        pass
+                    
+                    # Final check
+                    if wait_for_any(self.driver, [condition("closed", "hidden", modal)], 5, cancel=self.stop_event)[0]:
+                        self.log_message("Modal finally closed with additional methods")
+                    else:
+                        self.log_message("Warning: Modal may still be visible, but continuing...")
+            
+            # Additional wait to ensure modal is fully closed
+            self.pacing.pause("modal_closed")
+            
+            # Final verification that modal is closed
+            try:
+                modal_still_visible = modal.is_displayed()
+                if modal_still_visible:
+                    self.log_message("Warning: Modal may still be visible")
+                else:
+                    self.log_message("Modal closure confirmed")
+            except:
+                self.log_message("Could not verify modal closure, but continuing...")
+                
+            laps.mark("modal_close")
+            self.log_message("Message sent and modal closed successfully")
+            return True
+            
+        except (TimeoutException, WebDriverException, NoSuchElementException) as e:
+            self.log_message(f"Error sending message: {str(e)}")
+            self.last_failure = "error_after_send" if send_clicked else "webdriver_error"
+            return False
+        finally:
+            laps.finish()
+        
+    @timed_phase("go_to_next_page")
+    def go_to_next_page(self):
+        """Navigate to the next page"""
+        if self.total_pages and self.current_page >= self.total_pages:
+            self.log_message(f"Page {self.current_page} is the last of {self.total_pages} pages")
+            return False
+        if self.has_next_page is False:
+            self.log_message(f"Pagination offers no page after {self.current_page}")
+            return False
+        try:
+            current_url = self.driver.current_url
+            
+            # Extract page number and increment
+            if "page=" in current_url:
+                new_url = re.sub(r'page=\d+', f'page={self.current_page + 1}', current_url)
+            else:
+                separator = "&" if "?" in current_url else "?"
+                new_url = f"{current_url}{separator}page={self.current_page + 1}"
+                
+            self.log_message(f"Navigating to page {self.current_page + 1}...")
+            recycle_reason = self.check_memory()
+            if recycle_reason:
+                self.recycle_browser(new_url, recycle_reason)
+            else:
+                self.load_url(new_url)
+            
+            # Verify navigation was successful
+            self.log_message("Verifying page navigation was successful...")
+            # Wait for page to start loading
+            matched, _ = wait_for_any(self.driver, [
+                condition("content", "present", PAGE_READY_SELECTOR),
+                condition("loading", "present", LOADING_SELECTOR),
+            ], 10, cancel=self.stop_event)
+            if matched:
+                self.log_message(f"Page navigation verified - {matched} detected")
+            else:
+                self.log_message("Warning: No immediate content detected after navigation, but continuing...")
+            
+            self.current_page += 1
+            
+            # Save progress after navigating to next page
+            self.save_progress(new_url, self.current_page, 0)  # 0 because we haven't messaged anyone on new page yet
+            
+            self.log_message(f"Successfully navigated to page {self.current_page}")
+            return True
+            
+        except (WebDriverException, OSError, ValueError) as e:
+            self.log_message(f"Error navigating to next page: {str(e)}")
+            return False
+        
+    @timed_phase("wait_for_page_load")
+    def wait_for_page_load(self):
+        """Wait until the page has loaded and its card list has stopped changing"""
+        try:
+            self.log_message(f"Waiting for page to fully load (max {self.page_load_timeout} seconds)...")
+            if self.wait_until_quiet("Page", PAGE_READY_SELECTOR, self.page_quiet_ms,
+                                     self.page_load_timeout, results=MESSAGE_BUTTON_XPATH) == "quiet":
+                self.log_message("Page fully loaded and ready")
+            else:
+                self.log_message("Page not settled before timeout, but continuing...")
+                
+        except Exception as e:
+            self.log_message(f"Error waiting for page load: {str(e)}")
+        self.report_navigation()
+        
+    def load_url(self, url):
+        """Navigate to url and start timing (and metering) the navigation"""
+        if self.navigation_meter:
+            self.navigation_meter.begin()
+        self.navigation_started = time.perf_counter()
+        self.driver.get(url)
+        
+    def report_navigation(self):
+        """Log the load time and, when metered, the traffic of the last navigation"""
+        if self.navigation_started is None:
+            return
+        line = f"Page load took {time.perf_counter() - self.navigation_started:.2f}s"
+        self.navigation_started = None
+        if self.navigation_meter:
+            try:
+                figures = self.navigation_meter.finish()
+                if figures:
+                    line += f" - {self.navigation_meter.describe(figures)}"
+            except WebDriverException as e:
+                self.log_message(f"Could not read navigation traffic: {str(e)}")
+        self.log_message(line)
+        
+    def wait_until_quiet(self, what, ready_selector, quiet_ms, timeout, scope=None, results=None):
+        """Wait for the DOM (the dialog, the results list or the page) to settle and log how long it took"""
+        result = wait_for_dom_quiet(self.driver, ready_selector, scope, quiet_ms, timeout, cancel=self.stop_event,
+                                    results_xpath=results[1] if results else None)
+        status = result.get("status")
+        if status == "quiet":
+            self.log_message(f"{what} settled after {result['elapsed'] / 1000:.1f}s")
+        elif status == "busy":
+            self.log_message(f"{what} still changing after {timeout}s, continuing...")
+        elif status == "cancelled":
+            self.log_message(f"Stopped waiting for {what.lower()} - stop requested")
+        else:
+            self.log_message(f"{what} not found within {timeout}s")
+        return status
+        
+    def close(self):
+        """Close the dedup store and journal, quit Chrome and unlock its profile"""
+        self.messaged_users.close()
+        self.progress_journal.close()
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+            self.navigation_meter = None
+        self.release_browser_profile()
@@ -0,0 +1,105 @@
+"""
+Persistent, app-managed Chrome profiles guarded by a lock file
+"""
+import json
+import os
+import re
+import sys
+import time
+
+from startup_timer import process_start_time
+
+PROFILES_DIR = "browser_profiles"  # Named user-data directories live here
+LOCK_FILE = "bot.lock"
+
+
+def process_exists(pid):
+    """Whether a process with pid is running; None when this OS cannot tell"""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            # ERROR_INVALID_PARAMETER: no such process; anything else (access denied) proves nothing
+            return False if kernel32.GetLastError() == 87 else None
+        try:
+            exit_code = wintypes.DWORD()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return None
+            return exit_code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    if os.path.isdir("/proc"):
+        return os.path.exists(f"/proc/{pid}")
+    return None
+
+
+def profile_path(name, base_dir=PROFILES_DIR):
+    """Absolute user-data directory for a named profile"""
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", (name or "").strip()) or "default"
+    return os.path.abspath(os.path.join(base_dir, safe_name))
+
+
+class ProfileLock:
+    """Claim on a profile directory by one running bot instance
+
+    The lock file holds the owner's pid and process start time, so a lock
+    left behind by a crashed instance (or a pid that was reused since) is
+    recognised as stale and taken over.
+    """
+
+    def __init__(self, profile_dir):
+        self.path = os.path.join(profile_dir, LOCK_FILE)
+        self.held = False
+
+    def owner(self):
+        """The lock file's contents while its owner is alive, otherwise None"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            pid = int(data["pid"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if process_start_time(os.getpid()) is None:
+            # This OS cannot report start times; trust the lock unless the pid is known to be gone
+            return None if process_exists(pid) is False else data
+        started = process_start_time(pid)
+        if started is None or abs(started - data.get("started", 0)) > 2:
+            return None
+        return data
+
+    def acquire(self):
+        """Take the lock; False if another live instance holds it"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        claim = {
+            "pid": os.getpid(),
+            "started": process_start_time(os.getpid()) or time.time(),
+            "since": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        for _ in range(2):
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if self.owner() is not None:
+                    return False
+                try:
+                    os.remove(self.path)  # Stale lock of an instance that is gone
+                except OSError:
+                    pass
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(claim, f)
+            self.held = True
+            return True
+        return False
+
+    def release(self):
+        """Give the lock up if this instance holds it"""
+        if not self.held:
+            return
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+        self.held = False
@@ -1,10 +1,29 @@
 """
 Script to build the CoFoundersLab Bot into an executable file
 """
+import argparse
+import json
 import subprocess
 import sys
 import os
 
+APP_NAME = "CoFoundersLab_Bot"
+
+# "onefile" is a single portable .exe that unpacks itself to a temp folder on
+# every launch; "fast" is a folder build that starts without unpacking and
+# skips UPX so nothing has to be decompressed either.
+VARIANTS = {
+    "onefile": ["--onefile"],
+    "fast": ["--onedir", "--noupx", "--noconfirm"],
+}
+
+def executable_path(variant):
+    """Where PyInstaller puts the executable of a build variant"""
+    exe = APP_NAME + (".exe" if os.name == "nt" else "")
+    if variant == "onefile":
+        return os.path.join("dist", exe)
+    return os.path.join("dist", APP_NAME, exe)
+
 def install_pyinstaller():
     """Install PyInstaller if not already installed"""
     try:
@@ -14,18 +33,18 @@ def install_pyinstaller():
         print("Installing PyInstaller...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
 
-def build_executable():
+def build_executable(variant="onefile"):
     """Build the executable using PyInstaller"""
-    print("Building CoFoundersLab Bot executable...")
+    print(f"Building CoFoundersLab Bot executable ({variant} variant)...")
     
     # PyInstaller command
     cmd = [
         "pyinstaller",
-        "--onefile",  # Create a single executable file
+        *VARIANTS[variant],  # Single file or startup-optimized folder
         "--windowed",  # Don't show console window
-        "--name=CoFoundersLab_Bot",  # Name of the executable
+        f"--name={APP_NAME}",  # Name of the executable
         "--icon=icon.ico",  # Icon file (if exists)
-        "--add-data=requirements.txt;.",  # Include requirements file
+        f"--add-data=requirements.txt{os.pathsep}.",  # Include requirements file
         "cofounderslab_bot.py"
     ]
     
@@ -36,9 +55,12 @@ def build_executable():
     try:
         subprocess.run(cmd, check=True)
         print("\n✅ Executable created successfully!")
-        print("📁 Location: dist/CoFoundersLab_Bot.exe")
+        print(f"📁 Location: {executable_path(variant)}")
         print("\n📋 Instructions:")
-        print("1. Copy the .exe file to any folder")
+        if variant == "onefile":
+            print("1. Copy the .exe file to any folder")
+        else:
+            print(f"1. Copy the whole dist/{APP_NAME} folder; the .exe needs the files next to it")
         print("2. Make sure Chrome browser is installed")
         print("3. Run the .exe file")
         print("4. The bot will automatically download ChromeDriver")
@@ -49,10 +71,47 @@ def build_executable():
     
     return True
 
+def measure_startup(variant, runs):
+    """Launch the built executable several times and report launch-to-window times"""
+    exe = os.path.abspath(executable_path(variant))
+    if not os.path.exists(exe):
+        print(f"❌ {exe} not found - build the {variant} variant first")
+        return
+    work_dir = os.path.dirname(exe)
+    log_path = os.path.join(work_dir, "startup_times.log")
+    if os.path.exists(log_path):
+        os.remove(log_path)
+    for _ in range(runs):
+        # The app writes one line to startup_times.log and exits once its window is ready
+        subprocess.run([exe, "--measure-startup"], cwd=work_dir, check=False)
+    with open(log_path, "r", encoding="utf-8") as f:
+        times = [json.loads(line)["seconds"] for line in f if line.strip()]
+    if not times:
+        print("❌ No startup times were recorded")
+        return
+    print(f"⏱️ {variant} startup: first launch {times[0]:.2f}s", end="")
+    if len(times) > 1:
+        warm = sorted(times[1:])
+        print(f", warm launches median {warm[len(warm) // 2]:.2f}s (min {warm[0]:.2f}s, max {warm[-1]:.2f}s)")
+    else:
+        print()
+    print("   The first launch after a reboot or a rebuild is the cold one; startup_times.log keeps every run")
+
 def main():
+    parser = argparse.ArgumentParser(description="Build the CoFoundersLab Bot executable")
+    parser.add_argument("--variant", choices=sorted(VARIANTS), default="onefile",
+                        help="onefile: single portable .exe; fast: folder build that starts faster")
+    parser.add_argument("--measure", type=int, metavar="N",
+                        help="launch the built executable N times and report startup times instead of building")
+    args = parser.parse_args()
+    
     print("🚀 CoFoundersLab Bot - Executable Builder")
     print("=" * 50)
     
+    if args.measure:
+        measure_startup(args.variant, args.measure)
+        return
+    
     # Check if main script exists
     if not os.path.exists("cofounderslab_bot.py"):
         print("❌ Error: cofounderslab_bot.py not found!")
@@ -63,7 +122,7 @@ def main():
     install_pyinstaller()
     
     # Build executable
-    if build_executable():
+    if build_executable(args.variant):
         print("\n🎉 Build completed successfully!")
     else:
         print("\n💥 Build failed!")
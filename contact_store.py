@@ -0,0 +1,117 @@
+"""
+Persistent store of CoFoundersLab profiles that have already been messaged
+"""
+import hashlib
+import os
+import threading
+from urllib.parse import urlsplit
+
+
+def normalize_profile_key(raw_key):
+    """Turn a profile URL or id into a stable lookup key"""
+    if not raw_key:
+        return None
+    raw_key = raw_key.strip()
+    if raw_key.startswith(("http://", "https://", "/")):
+        parts = urlsplit(raw_key)
+        path = parts.path.rstrip("/")
+        if not path:
+            return None
+        return f"url:{path.lower()}"
+    return raw_key.lower()
+
+
+def name_key(user_name):
+    """Fallback key built from the name shown in the message modal"""
+    if not user_name or not user_name.strip():
+        return None
+    return f"name:{' '.join(user_name.lower().split())}"
+
+
+def drop_torn_tail(path):
+    """Cut an unterminated last line left by a crash; return the number of bytes dropped
+
+    Appending after such a line would glue the next record onto the
+    fragment, and both would be lost on the following load.
+    """
+    with open(path, "rb+") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return 0
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return 0
+        keep = 0
+        position = size
+        while position > 0:
+            step = min(4096, position)
+            position -= step
+            f.seek(position)
+            newline = f.read(step).rfind(b"\n")
+            if newline != -1:
+                keep = position + newline + 1
+                break
+        f.truncate(keep)
+        return size - keep
+
+
+class ContactStore:
+    """Append-only log of messaged profile keys with an in-memory hash index
+
+    Each key is kept in memory as a 64-bit digest, so hundreds of thousands
+    of contacts cost a few megabytes and lookups stay O(1). The log itself
+    holds the full keys, one per line, and is replayed once at startup.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._digests = set()
+        self._lock = threading.Lock()
+        self._file = None
+        self.load()
+
+    @staticmethod
+    def _digest(key):
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def load(self):
+        """Replay the log file into the in-memory index"""
+        with self._lock:
+            self._digests.clear()
+            if not os.path.exists(self.path):
+                return 0
+            drop_torn_tail(self.path)
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    key = line.rstrip("\n")
+                    if key:
+                        self._digests.add(self._digest(key))
+            return len(self._digests)
+
+    def add(self, key):
+        """Record a key, appending it to the log if it is new"""
+        if not key:
+            return False
+        digest = self._digest(key)
+        with self._lock:
+            if digest in self._digests:
+                return False
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(key + "\n")
+            self._file.flush()
+            self._digests.add(digest)
+            return True
+
+    def close(self):
+        """Close the underlying log file"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __contains__(self, key):
+        return bool(key) and self._digest(key) in self._digests
+
+    def __len__(self):
+        return len(self._digests)
@@ -0,0 +1,215 @@
+"""
+Browser-side waits that resolve on DOM state instead of fixed sleeps
+"""
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+# Longest any single browser-side wait may run; set on the driver at startup
+SCRIPT_TIMEOUT = 120
+
+# Longest single browser-side wait when a cancel event is given, so a set
+# event is noticed within about this many seconds
+CANCEL_SLICE = 1.0
+
+# Resolves once readySelector matches and the observed subtree has had no
+# mutations for quietMs, or when timeoutMs passes. The subtree is scope, or
+# with resultsXPath the list holding the elements it matches (only nodes
+# added or removed count there, so a toast, spinner or chat widget elsewhere
+# cannot keep the page busy), or else the whole document.
+QUIESCENCE_SCRIPT = """
+var readySelector = arguments[0], scope = arguments[1];
+var quietMs = arguments[2], timeoutMs = arguments[3], resultsXPath = arguments[4];
+var done = arguments[arguments.length - 1];
+var started = Date.now(), lastChange = started, mutations = 0, finished = false;
+var options = resultsXPath ? {childList: true, subtree: true} :
+    {childList: true, subtree: true, attributes: true, characterData: true};
+var observed = null;
+var observer = new MutationObserver(function (records) {
+    mutations += records.length;
+    lastChange = Date.now();
+});
+function resultsContainer() {
+    var found = document.evaluate(resultsXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    if (!found.snapshotLength) { return null; }
+    var first = found.snapshotItem(0), last = found.snapshotItem(found.snapshotLength - 1);
+    var node = first.parentElement;
+    if (first === last) {
+        // A single card: its list is a few levels up
+        for (var i = 0; i < 2 && node && node.parentElement; i++) { node = node.parentElement; }
+        return node;
+    }
+    while (node && !node.contains(last)) { node = node.parentElement; }
+    return node;
+}
+function watch() {
+    if (observed && observed !== document.documentElement && observed.isConnected) { return; }
+    var target = scope || (resultsXPath && resultsContainer()) || document.documentElement;
+    if (target === observed) { return; }
+    observer.disconnect();
+    observer.observe(target, options);
+    if (observed) { lastChange = Date.now(); }  // The results list appeared or was replaced
+    observed = target;
+}
+watch();
+var timer = setInterval(check, Math.min(50, quietMs));
+function finish(status) {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearInterval(timer);
+    done({status: status, elapsed: Date.now() - started, mutations: mutations});
+}
+function check() {
+    if (!scope && resultsXPath) { watch(); }
+    var now = Date.now();
+    var ready = !readySelector || document.querySelector(readySelector) !== null;
+    if (ready && document.readyState === 'complete' && now - lastChange >= quietMs) {
+        finish('quiet');
+    } else if (now - started >= timeoutMs) {
+        finish(ready ? 'busy' : 'timeout');
+    }
+}
+check();
+"""
+
+
+def _slices(timeout, cancel, minimum=0.0):
+    """Yield successive wait timeouts in seconds until timeout or cancel"""
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if cancel is None:
+            yield max(remaining, 0.0), True
+            return
+        chunk = min(remaining, max(CANCEL_SLICE, minimum))
+        yield max(chunk, 0.0), chunk >= remaining
+        if chunk >= remaining or cancel.is_set():
+            return
+
+
+def wait_for_dom_quiet(driver, ready_selector=None, scope=None, quiet_ms=400, timeout=15, cancel=None,
+                       results_xpath=None):
+    """Wait until ready_selector exists and the DOM has stopped changing
+
+    scope limits the observation to one element's subtree, such as a dialog.
+    Without a scope, results_xpath limits it to the list holding the
+    elements that XPath matches, such as a page's Message buttons.
+    Returns a dict with status 'quiet', 'busy' (present but still changing
+    when the timeout hit), 'timeout' (never present) or 'cancelled' (cancel
+    was set first), the elapsed time in milliseconds and the number of
+    mutations seen.
+    """
+    started = time.monotonic()
+    mutations = 0
+    result = {"status": "timeout"}
+    for chunk, last in _slices(min(timeout, SCRIPT_TIMEOUT - 5), cancel, 3 * quiet_ms / 1000):
+        timeout_ms = int(chunk * 1000)
+        try:
+            result = driver.execute_async_script(QUIESCENCE_SCRIPT, ready_selector, scope, quiet_ms, timeout_ms,
+                                                 results_xpath)
+        except TimeoutException:
+            result = {"status": "timeout", "mutations": None}
+        mutations += result.get("mutations") or 0
+        if result["status"] == "quiet" or last:
+            break
+        if cancel is not None and cancel.is_set():
+            result = {"status": "cancelled"}
+            break
+    result["elapsed"] = int((time.monotonic() - started) * 1000)
+    result["mutations"] = mutations
+    return result
+
+
+# Evaluates a set of conditions in the browser on every DOM mutation (and on a
+# short interval for layout-only changes) and resolves with the first one
+# that holds, so a multi-condition wait costs a single WebDriver command.
+WAIT_ANY_SCRIPT = """
+var conditions = arguments[0], scope = arguments[1] || document, timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var started = Date.now(), finished = false;
+function find(condition) {
+    if (condition.element) { return condition.element; }
+    if (condition.xpath) {
+        return document.evaluate(condition.xpath, scope, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return scope.querySelector(condition.css);
+}
+function visible(element) {
+    return !!(element && element.isConnected &&
+        (element.offsetWidth || element.offsetHeight || element.getClientRects().length));
+}
+function test(condition) {
+    var element = find(condition);
+    if (condition.kind === 'present') { return element && element.isConnected ? element : null; }
+    if (condition.kind === 'visible') { return visible(element) ? element : null; }
+    if (condition.kind === 'hidden') { return visible(element) ? null : true; }
+    return null;
+}
+function finish(result) {
+    finished = true;
+    observer.disconnect();
+    clearInterval(timer);
+    result.elapsed = Date.now() - started;
+    done(result);
+}
+function check() {
+    if (finished) { return; }
+    for (var i = 0; i < conditions.length; i++) {
+        var result = test(conditions[i]);
+        if (result) {
+            finish({matched: conditions[i].name, element: result === true ? null : result});
+            return;
+        }
+    }
+    if (Date.now() - started >= timeoutMs) {
+        finish({matched: null, element: null});
+    }
+}
+var observer = new MutationObserver(check);
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+var timer = setInterval(check, 100);
+check();
+"""
+
+
+def condition(name, kind, target):
+    """Describe one condition for wait_for_any
+
+    kind is 'present', 'visible' or 'hidden'; target is a CSS selector, a
+    (By, value) pair as produced by compile_selector, or a WebElement.
+    """
+    spec = {"name": name, "kind": kind}
+    if isinstance(target, tuple):
+        by, value = target
+        spec["xpath" if by == By.XPATH else "css"] = value
+    elif isinstance(target, str):
+        spec["css"] = target
+    else:
+        spec["element"] = target
+    return spec
+
+
+def wait_for_any(driver, conditions, timeout, scope=None, cancel=None):
+    """Wait in the browser until one of the conditions holds
+
+    Returns (name, element) for the first condition that matched, where
+    element is the matched element for 'present' and 'visible' conditions,
+    or (None, None) on timeout or once cancel is set. An element that has
+    already been removed from the page satisfies a 'hidden' condition.
+    """
+    for chunk, last in _slices(min(timeout, SCRIPT_TIMEOUT - 5), cancel):
+        try:
+            result = driver.execute_async_script(WAIT_ANY_SCRIPT, conditions, scope, int(chunk * 1000))
+        except TimeoutException:
+            result = {}
+        except StaleElementReferenceException:
+            for spec in conditions:
+                if spec["kind"] == "hidden" and "element" in spec:
+                    return spec["name"], None
+            raise
+        if result.get("matched") or last:
+            return result.get("matched"), result.get("element")
+    return None, None
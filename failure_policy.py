@@ -0,0 +1,68 @@
+"""
+Classification of failed sends, bounded per-card retries and a circuit breaker
+"""
+
+# Why send_message_to_user gave up on a card, with a hint for the diagnostic
+FAILURE_HINTS = {
+    "no_modal": "clicking Message no longer opens the dialog; the card or dialog markup may have changed",
+    "no_input": "the dialog has no recognisable message field; MESSAGE_INPUT_SELECTORS may be outdated",
+    "no_send_button": "the dialog has no recognisable Send button; SEND_BUTTON_SELECTORS may be outdated",
+    "throttled": "the site keeps answering with rate-limit or error banners",
+    "webdriver_error": "browser commands keep failing before the message was sent",
+    "error_after_send": "browser commands keep failing after Send was clicked",
+}
+
+# Failures that happen before Send is clicked, so retrying cannot double-send
+RETRYABLE_FAILURES = {"no_modal", "webdriver_error"}
+
+# Outcomes that say nothing about the health of the run: a user messaged
+# before, or a card that vanished from the page after a re-render
+NEUTRAL_OUTCOMES = {"duplicate", "card_gone"}
+
+
+class FailureBreaker:
+    """Counts consecutive failures of one kind and trips after threshold of them
+
+    The streak survives page changes, so a markup change that breaks every
+    card halts the run instead of walking through all remaining pages. The
+    first card of the streak is kept so progress can be left pointing at it.
+    """
+
+    def __init__(self, threshold=5, card_retries=1):
+        self.threshold = threshold
+        self.card_retries = card_retries
+        self.reset()
+
+    def reset(self):
+        """Forget the current streak"""
+        self.kind = None
+        self.streak = 0
+        self.first_failure = None  # (url, page, card index) of the streak's first card
+        self.tripped = False
+
+    def retries_for(self, kind):
+        """How many extra attempts a card that failed with kind gets"""
+        return self.card_retries if kind in RETRYABLE_FAILURES else 0
+
+    def record_success(self):
+        """A successful send ends any streak"""
+        self.kind = None
+        self.streak = 0
+        self.first_failure = None
+
+    def record_failure(self, kind, url, page, card_index):
+        """Count a failed card; return True when the breaker trips"""
+        if kind != self.kind:
+            self.kind = kind
+            self.streak = 0
+            self.first_failure = (url, page, card_index)
+        self.streak += 1
+        self.tripped = self.streak >= self.threshold
+        return self.tripped
+
+    def diagnostic(self):
+        """One-line explanation of why the breaker tripped"""
+        url, page, card_index = self.first_failure
+        hint = FAILURE_HINTS.get(self.kind, "unclassified failure")
+        return (f"{self.streak} consecutive '{self.kind}' failures starting at page {page}, "
+                f"user {card_index + 1} - {hint}")
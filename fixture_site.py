@@ -0,0 +1,331 @@
+"""
+Offline stand-in for the CoFoundersLab search pages and message modal
+
+Serves synthetic /search?page=N pages that use the same markup shapes the bot
+targets, so the automation can run end-to-end against a local Chrome with no
+network access:
+
+    python fixture_site.py --port 8765 --cards 20 --pages 50
+    set COFOUNDERSLAB_START_URL=http://127.0.0.1:8765/search?page=1
+    python cofounderslab_bot.py
+"""
+import argparse
+import html
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie",
+               "Avery", "Quinn", "Otwan", "Priya", "Mateo", "Lena", "Kofi", "Yuki"]
+LAST_NAMES = ["Marouf", "Nguyen", "Patel", "Garcia", "Smith", "Okafor", "Kim", "Rossi",
+              "Novak", "Silva", "Cohen", "Haddad", "Larsen", "Mensah", "Ito", "Weber"]
+
+# 1x1 transparent PNG used for avatars
+AVATAR_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082")
+
+
+class FixtureConfig:
+    """Shape and failure modes of the synthetic site"""
+
+    def __init__(self, cards=20, pages=50, render_delay_ms=300, modal_delay_ms=150,
+                 send_failure_rate=0.0, rate_limit_after=None, dead_button_rate=0.0,
+                 rerender_after_send=False, missing_link_rate=0.0, avatar_kb=40, seed=1):
+        self.cards = cards  # User cards per search page
+        self.pages = pages  # Pages with results; later pages are empty
+        self.render_delay_ms = render_delay_ms  # Delay before cards are rendered by script
+        self.modal_delay_ms = modal_delay_ms  # Delay before the message dialog appears
+        self.send_failure_rate = send_failure_rate  # Fraction of sends answered with HTTP 500
+        self.rate_limit_after = rate_limit_after  # Sends accepted before answering HTTP 429
+        self.dead_button_rate = dead_button_rate  # Fraction of Message buttons that open nothing
+        self.rerender_after_send = rerender_after_send  # Re-render the card list after each send
+        self.missing_link_rate = missing_link_rate  # Fraction of cards without a profile link
+        self.avatar_kb = avatar_kb  # Padding added to avatar responses, in kilobytes
+        self.seed = seed
+
+
+def user_for(config, page, index):
+    """Deterministic synthetic user for a card position"""
+    rng = random.Random(config.seed * 1000003 + page * 1009 + index)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    return {
+        "id": f"u{page}-{index}",
+        "name": name,
+        "role": rng.choice(["Technical co-founder", "Business co-founder", "Advisor", "Investor"]),
+        "link": rng.random() >= config.missing_link_rate,
+        "dead": rng.random() < config.dead_button_rate,
+    }
+
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Search | CoFoundersLab (fixture)</title>
+<link rel="stylesheet" href="/static/fonts.css">
+<script async src="/static/analytics.js"></script>
+<style>
+  .card {{ border: 1px solid #ddd; border-radius: 8px; padding: 12px; margin: 8px; display: flex; gap: 12px; }}
+  .banner {{ background: #fee; border: 1px solid #c00; padding: 8px; }}
+  [role=dialog] {{ position: fixed; inset: 0; background: rgba(0,0,0,.3); }}
+  [role=dialog] form {{ background: #fff; margin: 80px auto; width: 480px; padding: 16px; }}
+</style>
+</head>
+<body>
+<header><a href="/">CoFoundersLab</a> <input class="search-input" placeholder="Search"></header>
+<main>
+  <div id="banner"></div>
+  <div id="results" class="space-y-4"></div>
+  <nav aria-label="Pagination" class="pagination">{pagination}</nav>
+</main>
+<div id="headlessui-portal-root"></div>
+<script>
+window.__SEARCH__ = {payload};
+{script}
+</script>
+</body>
+</html>
+"""
+
+PAGE_SCRIPT = r"""
+(function () {
+  var data = window.__SEARCH__;
+  function esc(s) { var d = document.createElement('div'); d.textContent = s; return d.innerHTML; }
+  function cardHtml(u) {
+    var avatar = '<img class="h-12 w-12 rounded-full" src="/avatar/' + u.id + '.png" alt="">';
+    var name = '<div class="flex items-center gap-1"><p>' + esc(u.name) + '</p></div>';
+    return '<div class="card user-card rounded-lg border p-4" data-testid="user-card">' +
+      (u.link ? '<a href="/profile/' + u.id + '">' + avatar + '</a>' : avatar) +
+      '<div class="flex-1">' + name + '<p class="text-sm text-gray-500">' + esc(u.role) + '</p></div>' +
+      '<button type="button" data-user="' + u.id + '" class="inline-flex items-center justify-center gap-2 ' +
+      'border border-gray-300 rounded-md px-3 py-2"><svg width="16" height="16"></svg>' +
+      '<span class="inline-block">Message</span></button></div>';
+  }
+  function render() {
+    var results = document.getElementById('results');
+    if (!data.users.length) {
+      results.innerHTML = '<p class="empty-state">No results found</p>';
+      return;
+    }
+    results.innerHTML = data.users.map(cardHtml).join('');
+  }
+  function banner(text) {
+    var holder = document.getElementById('banner');
+    holder.innerHTML = '<div class="banner alert" role="alert">' + esc(text) + '</div>';
+    setTimeout(function () { holder.innerHTML = ''; }, 4000);
+  }
+  function closeDialog() {
+    var root = document.getElementById('headlessui-portal-root');
+    root.innerHTML = '';
+  }
+  function openDialog(u) {
+    var root = document.getElementById('headlessui-portal-root');
+    root.innerHTML =
+      '<div id="headlessui-dialog-:ri:" role="dialog" aria-modal="true" class="relative z-10">' +
+      '<div><form>' +
+      '<h3 class="text-lg font-semibold leading-6">Send ' + esc(u.name.split(' ')[0]) + ' a message</h3>' +
+      '<textarea name="message" rows="6" class="block w-full"></textarea>' +
+      '<div class="mt-6 grid grid-flow-row-dense grid-cols-2 gap-3">' +
+      '<button type="submit" class="inline-flex items-center justify-center gap-2 border border-transparent ' +
+      'disabled:opacity-50 bg-primary text-primary-content hover:bg-primary-hover hover:text-primary-content ' +
+      'disabled:hover:bg-primary px-4 py-2 rounded-md sm:col-start-2"><span class="inline-block">Send</span></button>' +
+      '<button type="button" class="cancel inline-flex items-center justify-center border px-4 py-2 rounded-md ' +
+      'sm:col-start-1">Cancel</button>' +
+      '</div></form></div></div>';
+    var form = root.querySelector('form');
+    root.querySelector('button.cancel').addEventListener('click', closeDialog);
+    form.addEventListener('submit', function (event) {
+      event.preventDefault();
+      var body = JSON.stringify({user: u.id, name: u.name, message: form.message.value});
+      fetch('/api/messages', {method: 'POST', headers: {'Content-Type': 'application/json'}, body: body})
+        .then(function (response) {
+          if (response.status === 429) { banner('Too many requests. Please slow down and try again later.'); }
+          else if (!response.ok) { banner('Something went wrong. Please try again.'); }
+          closeDialog();
+          if (response.ok && data.rerender) { render(); }
+        });
+    });
+  }
+  document.addEventListener('keydown', function (event) {
+    if (event.key === 'Escape') { closeDialog(); }
+  });
+  document.getElementById('results').addEventListener('click', function (event) {
+    var button = event.target.closest('button[data-user]');
+    if (!button) { return; }
+    var user = data.users.filter(function (u) { return u.id === button.dataset.user; })[0];
+    if (!user || user.dead) { return; }
+    setTimeout(function () { openDialog(user); }, data.modalDelay);
+  });
+  setTimeout(render, data.renderDelay);
+})();
+"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>CoFoundersLab (fixture)</title></head>
+<body><header><button class="login">Log in</button> <a class="search" href="/search?page=1">Search</a></header>
+<p>Offline fixture of the CoFoundersLab search pages.</p></body></html>
+"""
+
+
+def render_search_page(config, page):
+    """Build the HTML of one search results page"""
+    users = [user_for(config, page, i) for i in range(config.cards)] if 1 <= page <= config.pages else []
+    payload = {
+        "page": page,
+        "totalPages": config.pages,
+        "users": users,
+        "renderDelay": config.render_delay_ms,
+        "modalDelay": config.modal_delay_ms,
+        "rerender": config.rerender_after_send,
+    }
+    first = max(1, page - 2)
+    last = min(config.pages, page + 2)
+    links = [f'<a href="/search?page={n}">{n}</a>' for n in range(first, last + 1)]
+    if last < config.pages:
+        links.append(f'<span>...</span><a href="/search?page={config.pages}">{config.pages}</a>')
+    if page < config.pages:
+        links.append(f'<a rel="next" href="/search?page={page + 1}">Next</a>')
+    else:
+        links.append('<span class="disabled" aria-disabled="true">Next</span>')
+    return PAGE_TEMPLATE.format(
+        pagination="".join(links),
+        payload=json.dumps(payload).replace("</", "<\\/"),
+        script=PAGE_SCRIPT,
+    )
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """HTTP server holding the fixture configuration and the messages it received"""
+
+    daemon_threads = True
+
+    def __init__(self, address, config):
+        super().__init__(address, FixtureHandler)
+        self.config = config
+        self.messages = []
+        self.rejected = 0
+        self.lock = threading.Lock()
+        self.rng = random.Random(config.seed)
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Routes requests of the fixture site"""
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark and bot output clean
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8"):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        config = self.server.config
+        if parts.path == "/":
+            self._send(200, HOME_PAGE)
+        elif parts.path == "/search":
+            query = parse_qs(parts.query)
+            try:
+                page = int(query.get("page", ["1"])[0])
+            except ValueError:
+                page = 1
+            self._send(200, render_search_page(config, page))
+        elif parts.path.startswith("/profile/"):
+            user_id = html.escape(parts.path.rsplit("/", 1)[-1])
+            self._send(200, f"<!DOCTYPE html><html><body><h1>Profile {user_id}</h1></body></html>")
+        elif parts.path.startswith("/avatar/"):
+            self._send(200, AVATAR_PNG + b"\0" * (config.avatar_kb * 1024), "image/png")
+        elif parts.path == "/static/analytics.js":
+            self._send(200, "/* analytics */" + " " * 50000, "application/javascript")
+        elif parts.path == "/static/fonts.css":
+            self._send(200, "/* fonts */", "text/css")
+        elif parts.path == "/api/messages":
+            with self.server.lock:
+                body = json.dumps({"messages": self.server.messages, "rejected": self.server.rejected})
+            self._send(200, body, "application/json")
+        else:
+            self._send(404, "Not found")
+
+    def do_POST(self):
+        if urlsplit(self.path).path != "/api/messages":
+            self._send(404, "Not found")
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            message = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send(400, "Bad request")
+            return
+        config = self.server.config
+        with self.server.lock:
+            limited = config.rate_limit_after is not None and len(self.server.messages) >= config.rate_limit_after
+            failed = self.server.rng.random() < config.send_failure_rate
+            if limited or failed:
+                self.server.rejected += 1
+            else:
+                self.server.messages.append(message)
+        if limited:
+            self._send(429, '{"error": "rate limited"}', "application/json")
+        elif failed:
+            self._send(500, '{"error": "internal"}', "application/json")
+        else:
+            self._send(200, '{"ok": true}', "application/json")
+
+
+def start_fixture_server(config=None, host="127.0.0.1", port=0):
+    """Start the fixture site in a background thread and return the server"""
+    server = FixtureServer((host, port), config or FixtureConfig())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline CoFoundersLab fixture site")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cards", type=int, default=20, help="user cards per page")
+    parser.add_argument("--pages", type=int, default=50, help="pages with results")
+    parser.add_argument("--render-delay-ms", type=int, default=300)
+    parser.add_argument("--modal-delay-ms", type=int, default=150)
+    parser.add_argument("--send-failure-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-after", type=int, default=None)
+    parser.add_argument("--dead-button-rate", type=float, default=0.0)
+    parser.add_argument("--rerender-after-send", action="store_true")
+    parser.add_argument("--missing-link-rate", type=float, default=0.0)
+    parser.add_argument("--avatar-kb", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    config = FixtureConfig(
+        cards=args.cards, pages=args.pages, render_delay_ms=args.render_delay_ms,
+        modal_delay_ms=args.modal_delay_ms, send_failure_rate=args.send_failure_rate,
+        rate_limit_after=args.rate_limit_after, dead_button_rate=args.dead_button_rate,
+        rerender_after_send=args.rerender_after_send, missing_link_rate=args.missing_link_rate,
+        avatar_kb=args.avatar_kb, seed=args.seed)
+    server = FixtureServer((args.host, args.port), config)
+    print(f"Fixture site running at {server.base_url}/search?page=1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
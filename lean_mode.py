@@ -0,0 +1,133 @@
+"""
+Lean browser mode: blocks heavy non-essential requests and meters each navigation
+"""
+import json
+import time
+
+DEFAULT_LEAN = {
+    # Chrome DevTools URL patterns ('*' is a wildcard) that are never fetched
+    "blocked_urls": [
+        "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.ico*",
+        "*.woff*", "*.ttf*", "*.otf*",
+        "*.mp4*", "*.webm*",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*connect.facebook.net*", "*hotjar.com*", "*segment.com*", "*segment.io*",
+        "*mixpanel.com*", "*fullstory.com*", "*clarity.ms*", "*px.ads.linkedin.com*",
+    ],
+    # Typical size of a blocked response by resource type, for the bytes-saved estimate
+    "estimated_bytes": {
+        "Image": 20000,
+        "Font": 30000,
+        "Media": 500000,
+        "Script": 50000,
+        "Stylesheet": 15000,
+        "Other": 5000,
+    },
+}
+
+
+def load_lean_settings(path):
+    """Return DEFAULT_LEAN updated with the overrides found in path"""
+    settings = json.loads(json.dumps(DEFAULT_LEAN))
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+    except (OSError, ValueError):
+        return settings
+    estimates = overrides.pop("estimated_bytes", {})
+    settings.update(overrides)
+    settings["estimated_bytes"].update(estimates)
+    return settings
+
+
+def format_bytes(count):
+    """Human readable byte count"""
+    if count >= 1024 * 1024:
+        return f"{count / (1024 * 1024):.1f} MB"
+    return f"{count / 1024:.1f} KB"
+
+
+class NavigationMeter:
+    """Sums the network traffic of each navigation from Chrome's performance log
+
+    Chrome must have been started with the performance log enabled (see
+    chrome_logging_options). With blocking on, requests refused by the block
+    list are counted and their size is estimated from their resource type.
+    """
+
+    def __init__(self, driver, settings, blocking=True):
+        self.driver = driver
+        self.settings = settings
+        self.blocking = blocking
+        self.started = None
+        self.navigations = 0
+        self.total_seconds = 0.0
+        self.total_bytes = 0
+        self.total_blocked = 0
+        self.total_saved = 0
+
+    @staticmethod
+    def chrome_logging_options(chrome_options):
+        """Have Chrome record network events in the performance log"""
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+    def install(self):
+        """Turn on the DevTools block list for the current tab"""
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        if self.blocking:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(self.settings["blocked_urls"])})
+
+    def drain(self):
+        """Read and clear the performance log; return (bytes, requests, blocked, estimated saved)"""
+        loaded = requests = blocked = saved = 0
+        estimates = self.settings["estimated_bytes"]
+        for entry in self.driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError, TypeError):
+                continue
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.loadingFinished":
+                loaded += int(params.get("encodedDataLength", 0))
+                requests += 1
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked += 1
+                saved += estimates.get(params.get("type"), estimates.get("Other", 0))
+        return loaded, requests, blocked, saved
+
+    def begin(self):
+        """Start metering a navigation, dropping traffic recorded since the last one"""
+        self.drain()
+        self.started = time.perf_counter()
+
+    def finish(self):
+        """Stop metering the current navigation and return its figures, or None"""
+        if self.started is None:
+            return None
+        seconds = time.perf_counter() - self.started
+        self.started = None
+        loaded, requests, blocked, saved = self.drain()
+        self.navigations += 1
+        self.total_seconds += seconds
+        self.total_bytes += loaded
+        self.total_blocked += blocked
+        self.total_saved += saved
+        return {"seconds": seconds, "bytes": loaded, "requests": requests, "blocked": blocked, "saved": saved}
+
+    def describe(self, figures):
+        """One log line for a navigation's figures"""
+        line = f"{format_bytes(figures['bytes'])} in {figures['requests']} requests"
+        if self.blocking:
+            line += f", {figures['blocked']} blocked (~{format_bytes(figures['saved'])} saved)"
+        return line
+
+    def summary(self):
+        """Totals over all metered navigations, or None before the first one"""
+        if not self.navigations:
+            return None
+        line = (f"{self.navigations} navigations, {format_bytes(self.total_bytes)} loaded, "
+                f"average load {self.total_seconds / self.navigations:.2f}s")
+        if self.blocking:
+            line += f", {self.total_blocked} requests blocked (~{format_bytes(self.total_saved)} saved)"
+        return line
@@ -0,0 +1,94 @@
+"""
+Watches the browser's memory and decides when to recycle it at a page boundary
+"""
+import os
+
+# Chrome's non-standard heap counter; null in browsers without it
+JS_HEAP_SCRIPT = "return performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+
+def process_tree(root_pid):
+    """Return root_pid and all of its descendants (Linux /proc only)"""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(int(entry))
+        except (OSError, IndexError):
+            continue
+    pids, stack = [], [root_pid]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return pids
+
+
+def renderer_rss_mb(root_pid):
+    """Summed RSS in MB of the Chrome renderers under root_pid, or None without /proc"""
+    if not os.path.isdir("/proc"):
+        return None
+    rss_kb = 0
+    for pid in process_tree(root_pid):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                if b"--type=renderer" not in f.read():
+                    continue
+            with open(f"/proc/{pid}/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        rss_kb += int(line.split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    return rss_kb / 1024
+
+
+class MemoryGuard:
+    """Samples the JS heap and renderer RSS once per page and asks for a recycle past a limit
+
+    The renderer of one long-lived tab keeps growing over hundreds of pages.
+    Swapping it for a fresh one between pages gives that memory back without
+    touching the run's state. A limit of 0 turns its check off.
+    """
+
+    def __init__(self, heap_limit_mb=512, rss_limit_mb=1024, page_limit=200):
+        self.heap_limit_mb = heap_limit_mb
+        self.rss_limit_mb = rss_limit_mb
+        self.page_limit = page_limit
+        self.pages = 0  # Pages finished since Chrome started or was last recycled
+        self.recycles = 0
+
+    def sample(self, driver, root_pid=None):
+        """Current JS heap of the tab and RSS of the renderers, in MB (None when unknown)"""
+        heap_bytes = driver.execute_script(JS_HEAP_SCRIPT)
+        return {
+            "heap_mb": heap_bytes / (1024 * 1024) if heap_bytes else None,
+            "rss_mb": renderer_rss_mb(root_pid) if root_pid else None,
+        }
+
+    def check(self, sample):
+        """Count a finished page; return why the browser should be recycled, or None"""
+        self.pages += 1
+        heap, rss = sample["heap_mb"], sample["rss_mb"]
+        if self.heap_limit_mb and heap is not None and heap >= self.heap_limit_mb:
+            return f"JS heap {heap:.0f} MB reached the {self.heap_limit_mb} MB limit"
+        if self.rss_limit_mb and rss is not None and rss >= self.rss_limit_mb:
+            return f"renderer RSS {rss:.0f} MB reached the {self.rss_limit_mb} MB limit"
+        if self.page_limit and self.pages >= self.page_limit:
+            return f"{self.pages} pages since the browser was last recycled"
+        return None
+
+    def recycled(self):
+        """Start counting again after the tab or Chrome was replaced"""
+        self.pages = 0
+        self.recycles += 1
+
+    @staticmethod
+    def describe(sample):
+        """One log fragment for a sample"""
+        heap = f"{sample['heap_mb']:.0f} MB" if sample["heap_mb"] is not None else "n/a"
+        rss = f"{sample['rss_mb']:.0f} MB" if sample["rss_mb"] is not None else "n/a"
+        return f"JS heap {heap}, renderer RSS {rss}"
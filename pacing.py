@@ -0,0 +1,152 @@
+"""
+Central pacing policy: deliberate delays, send ceilings and server-throttle backoff
+"""
+import json
+import random
+import time
+
+# Every deliberate delay and limit of the bot, in seconds unless noted.
+# Override any of them in pacing.json next to the bot.
+DEFAULT_PACING = {
+    "contact_gap_seconds": 5.0,  # Minimum gap between two contacts
+    "contact_gap_jitter": 2.0,  # Random extra gap added on top of the minimum
+    "action_jitter": 0.25,  # Fractional jitter applied to the action delays below
+    "action_delays": {
+        "after_click": 2.0,  # After clicking a Message button
+        "after_clear": 1.0,  # After clearing the message field
+        "after_clear_retry": 0.5,  # After clearing a field that was not empty
+        "after_type": 2.0,  # After typing the message
+        "before_send": 1.0,  # Before looking for the Send button
+        "send_enable": 2.0,  # When the Send button is still disabled
+        "after_send": 3.0,  # After clicking Send
+        "after_close": 2.0,  # After each attempt to close the dialog
+        "modal_closed": 3.0,  # After the dialog has closed
+        "before_retry": 2.0,  # Before retrying a card whose dialog did not open
+    },
+    "daily_cap": 0,  # Messages per calendar day, across sessions; 0 or null for no cap
+    "session_cap": 0,  # Messages per run of the automation; 0 or null for no cap
+    "failure_threshold": 3,  # Consecutive failed sends before backing off
+    "backoff_base_seconds": 60.0,  # First backoff delay
+    "backoff_max_seconds": 1800.0,  # Longest backoff delay
+}
+
+# Finds a visible rate-limit or error banner and returns its text
+THROTTLE_BANNER_SCRIPT = """
+var pattern = /too many|rate limit|slow down|try again later|temporarily blocked|something went wrong/i;
+var nodes = document.querySelectorAll("[role='alert'], [class*='toast'], [class*='alert'], [class*='banner'], [class*='error']");
+for (var i = 0; i < nodes.length; i++) {
+    var text = (nodes[i].innerText || '').trim();
+    if (text && pattern.test(text) && nodes[i].getClientRects().length) {
+        return text.slice(0, 200);
+    }
+}
+return null;
+"""
+
+
+def load_pacing_settings(path):
+    """Return DEFAULT_PACING updated with the overrides found in path"""
+    settings = json.loads(json.dumps(DEFAULT_PACING))
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            overrides = json.load(f)
+    except (OSError, ValueError):
+        return settings
+    delays = overrides.pop("action_delays", {})
+    settings.update(overrides)
+    settings["action_delays"].update(delays)
+    return settings
+
+
+def detect_throttle(driver):
+    """Return the text of a visible rate-limit or error banner, if any"""
+    return driver.execute_script(THROTTLE_BANNER_SCRIPT)
+
+
+class PacingPolicy:
+    """Owns every deliberate delay, the send ceilings and the backoff state
+
+    Delays go through self.sleep so callers (the benchmark, cancellation)
+    can replace how the bot waits without touching the policy.
+    """
+
+    def __init__(self, settings=None, sleep=time.sleep):
+        self.settings = settings or json.loads(json.dumps(DEFAULT_PACING))
+        self.sleep = sleep
+        self.day = time.strftime("%Y-%m-%d")
+        self.sent_today = 0
+        self.sent_session = 0
+        self.consecutive_failures = 0
+        self.backoff_level = 0
+        self.backoff_until = 0.0
+        self.last_contact = None  # When the previous contact finished
+
+    def start_session(self, sent_today=0, day=None):
+        """Reset per-run counters; sent_today comes from the progress journal"""
+        self.day = time.strftime("%Y-%m-%d")
+        self.sent_today = sent_today if day == self.day else 0
+        self.sent_session = 0
+        self.consecutive_failures = 0
+        self.last_contact = None
+
+    def pause(self, name):
+        """Sleep for one of the named action delays, with jitter"""
+        delay = self.settings["action_delays"].get(name, 0.0)
+        jitter = self.settings["action_jitter"]
+        if delay > 0:
+            self.sleep(delay * random.uniform(1 - jitter, 1 + jitter))
+
+    def can_send(self):
+        """Return (allowed, reason) according to the daily and session ceilings"""
+        today = time.strftime("%Y-%m-%d")
+        if today != self.day:
+            self.day = today
+            self.sent_today = 0
+        daily_cap, session_cap = self.settings.get("daily_cap"), self.settings.get("session_cap")
+        if daily_cap and self.sent_today >= daily_cap:
+            return False, f"daily limit of {daily_cap} messages reached"
+        if session_cap and self.sent_session >= session_cap:
+            return False, f"session limit of {session_cap} messages reached"
+        return True, None
+
+    def wait_before_contact(self):
+        """Sleep out the rest of the gap since the last contact finished and any backoff; return the wait"""
+        now = time.monotonic()
+        wait = 0.0
+        if self.last_contact is not None:
+            gap = self.settings["contact_gap_seconds"] + random.uniform(0, self.settings["contact_gap_jitter"])
+            wait = max(0.0, gap - (now - self.last_contact))
+        wait = max(wait, self.backoff_until - now)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    def contact_finished(self):
+        """Start the contact gap once the attempts on a contact are over"""
+        self.last_contact = time.monotonic()
+
+    def record_result(self, sent):
+        """Update counters after a send attempt; return the backoff delay started, if any"""
+        if sent:
+            self.sent_today += 1
+            self.sent_session += 1
+            self.consecutive_failures = 0
+            self.backoff_level = max(0, self.backoff_level - 1)
+            return 0.0
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.settings["failure_threshold"]:
+            self.consecutive_failures = 0
+            return self._back_off()
+        return 0.0
+
+    def record_throttle(self):
+        """Back off immediately after the site pushed back"""
+        return self._back_off()
+
+    def _back_off(self):
+        self.backoff_level += 1
+        delay = min(self.settings["backoff_max_seconds"],
+                    self.settings["backoff_base_seconds"] * 2 ** (self.backoff_level - 1))
+        delay *= random.uniform(0.8, 1.2)
+        self.backoff_until = time.monotonic() + delay
+        return delay
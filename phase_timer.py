@@ -0,0 +1,121 @@
+"""
+Per-phase latency instrumentation for the automation flow
+"""
+import functools
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+def percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, math.ceil(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[rank]
+
+
+class PhaseLaps:
+    """Records consecutive phases of one operation as laps of a stopwatch"""
+
+    def __init__(self, timer, operation):
+        self.timer = timer
+        self.operation = operation
+        self.started = self.last = time.perf_counter()
+
+    def mark(self, phase):
+        """Record the time since the previous mark under this phase"""
+        now = time.perf_counter()
+        self.timer.record(f"{self.operation}.{phase}", now - self.last)
+        self.last = now
+
+    def finish(self):
+        """Record the total time of the operation"""
+        self.timer.record(f"{self.operation}.total", time.perf_counter() - self.started)
+
+
+class PhaseTimer:
+    """Collects per-phase durations and reports p50/p95/p99 latencies
+
+    Counts and totals are exact; percentiles are computed over the most
+    recent max_samples durations of each phase.
+    """
+
+    def __init__(self, max_samples=10000):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget all recorded phases"""
+        with self._lock:
+            self._samples = {}
+            self._totals = {}
+            self._counts = {}
+
+    def record(self, phase, seconds):
+        """Record one duration for a phase"""
+        with self._lock:
+            if phase not in self._samples:
+                self._samples[phase] = deque(maxlen=self.max_samples)
+                self._totals[phase] = 0.0
+                self._counts[phase] = 0
+            self._samples[phase].append(seconds)
+            self._totals[phase] += seconds
+            self._counts[phase] += 1
+
+    @contextmanager
+    def span(self, phase):
+        """Time the body of a with-block as one phase"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - started)
+
+    def laps(self, operation):
+        """Start a stopwatch for the phases of one operation"""
+        return PhaseLaps(self, operation)
+
+    def summary(self):
+        """Return count, total and percentiles for every phase"""
+        with self._lock:
+            phases = {phase: sorted(samples) for phase, samples in self._samples.items()}
+            totals = dict(self._totals)
+            counts = dict(self._counts)
+        return {
+            phase: {
+                "count": counts[phase],
+                "total": round(totals[phase], 4),
+                "p50": round(percentile(samples, 0.50), 4),
+                "p95": round(percentile(samples, 0.95), 4),
+                "p99": round(percentile(samples, 0.99), 4),
+            }
+            for phase, samples in phases.items()
+        }
+
+    def status_line(self, top=4):
+        """Short summary of the phases with the largest total time"""
+        with self._lock:
+            totals = sorted(self._totals.items(), key=lambda item: item[1], reverse=True)
+        phases = [(phase, total) for phase, total in totals if not phase.endswith(".total")][:top]
+        return " | ".join(f"{phase.split('.')[-1]} {total:.0f}s" for phase, total in phases)
+
+    def export(self, path):
+        """Write the full summary to a JSON file"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2, sort_keys=True)
+
+
+def timed_phase(phase):
+    """Decorator that times a bot method with the bot's phase_timer"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.phase_timer.span(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,152 @@
+"""
+Append-only, crash-safe journal of bot progress
+"""
+import json
+import os
+import threading
+import time
+
+from contact_store import drop_torn_tail
+
+
+def _apply(state, record):
+    """Fold one journal record into the progress state"""
+    kind = record.get("t")
+    if kind == "snapshot":
+        state.clear()
+        state.update(record.get("state", {}))
+        return
+    state["url"] = record.get("url", state.get("url"))
+    state["page"] = record.get("page", state.get("page"))
+    state["updated"] = record.get("ts", state.get("updated"))
+    if kind == "send":
+        day = time.strftime("%Y-%m-%d", time.localtime(record.get("ts", 0)))
+        if state.get("day") != day:
+            state["day"] = day
+            state["sent_today"] = 0
+        state["sent_today"] = state.get("sent_today", 0) + 1
+        state["total_messaged"] = state.get("total_messaged", 0) + 1
+        state["page_messaged"] = state.get("page_messaged", 0) + 1
+        state["card"] = record.get("card", state.get("card"))
+    elif kind == "page":
+        state["page_messaged"] = record.get("messaged", 0)
+        state["card"] = None
+    elif kind == "halt":
+        state["card"] = record.get("card")
+
+
+class ProgressJournal:
+    """Journal that appends one JSON line per send or page transition
+
+    Lines are written with a single write call and fsynced in batches, so a
+    crash loses at most the last unsynced batch and never truncates older
+    records; a torn final line is cut off on load. Once enough records pile
+    up the journal is compacted in a background thread into one snapshot
+    record, written to a temporary file and swapped in with os.replace.
+    """
+
+    def __init__(self, path, sync_every=20, sync_interval=5.0, compact_after=5000):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.compact_after = compact_after
+        self.state = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._records = 0
+        self._compacting = False
+
+    def load(self):
+        """Rebuild the progress state from the journal in one streaming pass"""
+        with self._lock:
+            state = {}
+            records = 0
+            if os.path.exists(self.path):
+                # Cut a torn final line so the next append does not glue onto it
+                drop_torn_tail(self.path)
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue  # Torn write from a crash
+                        _apply(state, record)
+                        records += 1
+            self.state = state
+            self._records = records
+            return dict(state)
+
+    def record_send(self, url, page, key, card_index):
+        """Append a record for a successfully messaged user"""
+        self._append({"t": "send", "url": url, "page": page, "key": key, "card": card_index})
+
+    def record_page(self, url, page, messaged_count):
+        """Append a record for a page transition or completed page"""
+        self._append({"t": "page", "url": url, "page": page, "messaged": messaged_count})
+
+    def record_halt(self, url, page, first_failed_index):
+        """Append a record that points progress at the first failed card of a halted run"""
+        card = first_failed_index - 1 if first_failed_index > 0 else None
+        self._append({"t": "halt", "url": url, "page": page, "card": card})
+
+    def _append(self, record):
+        record["ts"] = time.time()
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            _apply(self.state, record)
+            self._records += 1
+            self._unsynced += 1
+            if (self._unsynced >= self.sync_every or
+                    time.monotonic() - self._last_sync >= self.sync_interval):
+                self._sync_locked()
+            start_compaction = self._records >= self.compact_after and not self._compacting
+            if start_compaction:
+                self._compacting = True
+        if start_compaction:
+            threading.Thread(target=self._compact, daemon=True).start()
+
+    def _sync_locked(self):
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """Force pending records to disk"""
+        with self._lock:
+            self._sync_locked()
+
+    def _compact(self):
+        """Replace the journal with a single snapshot of the current state"""
+        tmp_path = self.path + ".tmp"
+        try:
+            with self._lock:
+                snapshot = {"t": "snapshot", "ts": time.time(), "state": self.state}
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(snapshot, separators=(",", ":")) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                os.replace(tmp_path, self.path)
+                self._records = 1
+                self._unsynced = 0
+        except OSError:
+            pass  # The uncompacted journal is still valid
+        finally:
+            self._compacting = False
+
+    def close(self):
+        """Sync and close the journal"""
+        with self._lock:
+            self._sync_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
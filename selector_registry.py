@@ -0,0 +1,100 @@
+"""
+Adaptive registry of selector strategies for the UI elements the bot looks up
+"""
+import json
+import os
+import threading
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
+
+
+def _strategy(selector):
+    """Normalize a CSS string or a (By, value) pair into a (By, value) pair"""
+    if isinstance(selector, tuple):
+        return selector
+    return (By.CSS_SELECTOR, selector)
+
+
+def _stats_key(strategy):
+    by, value = strategy
+    return value if by == By.CSS_SELECTOR else f"{by}={value}"
+
+
+class SelectorRegistry:
+    """Tries the strategy that matched last time first and persists hit/miss counts
+
+    Strategies are ordered per UI element: the previous winner, then the
+    remaining ones by hit count, keeping the declared order for ties. Each
+    attempt uses find_elements, so a miss costs one round-trip and never
+    raises.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        """Read the persisted statistics, ignoring a missing or corrupt file"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._stats = json.load(f)
+        except (OSError, ValueError):
+            self._stats = {}
+
+    def save(self):
+        """Write the statistics atomically if they changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._stats, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+    def ordered(self, element, selectors):
+        """Return the strategies for an element in the order they should be tried"""
+        strategies = [_strategy(selector) for selector in selectors]
+        with self._lock:
+            stats = self._stats.get(element, {})
+            last = stats.get("_last")
+            hits = {key: value.get("hits", 0) for key, value in stats.items() if key != "_last"}
+        ranked = sorted(enumerate(strategies),
+                        key=lambda item: (_stats_key(item[1]) != last, -hits.get(_stats_key(item[1]), 0), item[0]))
+        return [strategy for _, strategy in ranked]
+
+    def _record(self, element, strategy, hit):
+        key = _stats_key(strategy)
+        with self._lock:
+            stats = self._stats.setdefault(element, {})
+            entry = stats.setdefault(key, {"hits": 0, "misses": 0})
+            entry["hits" if hit else "misses"] += 1
+            if hit:
+                stats["_last"] = key
+            self._dirty = True
+
+    def find(self, scope, element, selectors, multiple=False):
+        """Look up an element within scope (a driver or WebElement)
+
+        Returns (result, selector) where result is the list of matches when
+        multiple is true and the first match otherwise; (None or [], None)
+        when no strategy matches.
+        """
+        for strategy in self.ordered(element, selectors):
+            try:
+                matches = scope.find_elements(*strategy)
+            except WebDriverException:
+                matches = []
+            self._record(element, strategy, bool(matches))
+            if matches:
+                return (matches if multiple else matches[0]), _stats_key(strategy)
+        return ([] if multiple else None), None
+
+    def report(self):
+        """Hit and miss counts per element"""
+        with self._lock:
+            return json.loads(json.dumps(self._stats))
@@ -0,0 +1,77 @@
+"""
+Launch-to-window timing for the script and packaged builds
+
+Only uses the standard library so it can be imported before anything else.
+"""
+import json
+import os
+import sys
+import time
+
+STARTUP_LOG = "startup_times.log"  # One JSON line per measured launch
+
+# Fallback when the OS cannot tell when the process started
+IMPORTED_AT = time.time()
+
+
+def build_kind():
+    """'onefile' or 'onedir' for PyInstaller builds, 'script' otherwise"""
+    if not getattr(sys, "frozen", False):
+        return "script"
+    bundle_dir = getattr(sys, "_MEIPASS", "")
+    return "onefile" if os.path.basename(bundle_dir).startswith("_MEI") else "onedir"
+
+
+def process_start_time(pid):
+    """Creation time of a process as a Unix timestamp, or None if unknown"""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+            if not handle:
+                return None
+            try:
+                times = [wintypes.FILETIME() for _ in range(4)]
+                if not kernel32.GetProcessTimes(handle, *[ctypes.byref(t) for t in times]):
+                    return None
+            finally:
+                kernel32.CloseHandle(handle)
+            ticks = (times[0].dwHighDateTime << 32) | times[0].dwLowDateTime
+            return ticks / 10_000_000 - 11_644_473_600  # FILETIME counts 100 ns since 1601
+        if os.path.exists(f"/proc/{pid}/stat"):
+            with open(f"/proc/{pid}/stat", "r") as f:
+                start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+            with open("/proc/uptime", "r") as f:
+                uptime = float(f.read().split()[0])
+            return time.time() - (uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+    return None
+
+
+def launch_time():
+    """When the user launched the program
+
+    A onefile build runs as two processes: the bootloader unpacks the bundle
+    and then starts the Python process, so the launch is the parent's start.
+    """
+    pid = os.getppid() if build_kind() == "onefile" else os.getpid()
+    return process_start_time(pid) or IMPORTED_AT
+
+
+def record_startup(path=STARTUP_LOG):
+    """Append the seconds from launch until now to path and return them"""
+    seconds = time.time() - launch_time()
+    entry = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "build": build_kind(),
+        "seconds": round(seconds, 3),
+    }
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError:
+        pass
+    return seconds
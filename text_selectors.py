@@ -0,0 +1,118 @@
+"""
+Compiles jQuery-style ":contains()" selectors into XPath that WebDriver accepts
+"""
+import re
+
+from selenium.webdriver.common.by import By
+
+_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_LOWER = "abcdefghijklmnopqrstuvwxyz"
+
+_TOKEN = re.compile(r"""
+    (?P<tag>^[a-zA-Z][\w-]*|^\*)
+  | \.(?P<cls>(?:\\.|[\w-])+)
+  | \#(?P<id>(?:\\.|[\w-])+)
+  | \[(?P<attr>[\w-]+)(?:(?P<op>[*^]?=)['"](?P<value>[^'"]*)['"])?\]
+  | :contains\(['"](?P<text>[^'"]*)['"]\)
+  | :has\((?P<has>[\w-]+)\)
+""", re.VERBOSE)
+
+# Commas and whitespace inside quoted :contains() text are not separators
+_GROUP_SPLIT = re.compile(r",(?=(?:[^'\"]|'[^']*'|\"[^\"]*\")*$)")
+_STEP = re.compile(r"""(?:[^\s>'"]|'[^']*'|"[^"]*")+|>""")
+
+
+def _literal(text):
+    """Quote a string as an XPath literal"""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+def _unescape(value):
+    return re.sub(r"\\(.)", r"\1", value)
+
+
+def _compound_to_xpath(compound):
+    """Translate one compound selector such as button.rounded:contains('Send')"""
+    tag = "*"
+    predicates = []
+    position = 0
+    while position < len(compound):
+        match = _TOKEN.match(compound, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Unsupported selector syntax: {compound!r}")
+        if match.group("tag"):
+            tag = match.group("tag")
+        elif match.group("cls"):
+            cls = _unescape(match.group("cls"))
+            predicates.append(f"contains(concat(' ', normalize-space(@class), ' '), {_literal(' ' + cls + ' ')})")
+        elif match.group("id"):
+            predicates.append(f"@id={_literal(_unescape(match.group('id')))}")
+        elif match.group("attr"):
+            attr, op, value = match.group("attr"), match.group("op"), match.group("value")
+            if not op:
+                predicates.append(f"@{attr}")
+            elif op == "*=":
+                predicates.append(f"contains(@{attr}, {_literal(value)})")
+            elif op == "^=":
+                predicates.append(f"starts-with(@{attr}, {_literal(value)})")
+            else:
+                predicates.append(f"@{attr}={_literal(value)}")
+        elif match.group("text") is not None:
+            predicates.append(f"contains(., {_literal(match.group('text'))})")
+        elif match.group("has"):
+            predicates.append(f".//*[local-name()={_literal(match.group('has'))}]")
+        position = match.end()
+    return tag + "".join(f"[{predicate}]" for predicate in predicates)
+
+
+def css_to_xpath(selector):
+    """Translate a CSS selector with :contains() into a scope-relative XPath"""
+    groups = []
+    for group in _GROUP_SPLIT.split(selector):
+        xpath = "."
+        axis = "//"
+        for step in _STEP.findall(group):
+            if step == ">":
+                axis = "/"
+                continue
+            xpath += axis + _compound_to_xpath(step)
+            axis = "//"
+        groups.append(xpath)
+    return " | ".join(groups)
+
+
+def compile_selector(selector):
+    """Return a (By, value) strategy, compiling text predicates to XPath"""
+    if isinstance(selector, tuple):
+        return selector
+    if ":contains(" in selector:
+        return (By.XPATH, css_to_xpath(selector))
+    return (By.CSS_SELECTOR, selector)
+
+
+def compile_selectors(selectors):
+    """Compile a list of selectors for use with the selector registry"""
+    return [compile_selector(selector) for selector in selectors]
+
+
+def text_match_xpath(tag, text, include_class=False):
+    """XPath for tag elements whose text (or class) contains text, ignoring case
+
+    The text of an element includes all of its descendants, so a button whose
+    label sits in an inner span is matched by the same single query.
+    """
+    needle = _literal(text.lower())
+    predicate = f"contains(translate(normalize-space(.), '{_UPPER}', '{_LOWER}'), {needle})"
+    if include_class:
+        predicate += f" or contains(translate(@class, '{_UPPER}', '{_LOWER}'), {needle})"
+    return f".//{tag}[{predicate}]"
+
+
+def find_by_text(scope, tag, text, include_class=False):
+    """Find every tag element under scope whose text contains text, in one query"""
+    return scope.find_elements(By.XPATH, text_match_xpath(tag, text, include_class))
@@ -0,0 +1,113 @@
+"""
+Counts and times WebDriver round-trips made by the bot
+"""
+import json
+import os
+import sys
+import threading
+import time
+
+_SELENIUM_DIR = os.sep + "selenium" + os.sep
+
+
+def _call_site():
+    """Return 'function:line' of the first caller outside Selenium and this module"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if _SELENIUM_DIR not in filename and filename != __file__:
+            return f"{frame.f_code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "unknown"
+
+
+class WebDriverProfiler:
+    """Proxy over a driver's command channel that records every round-trip
+
+    Every WebDriver command, including those issued through WebElement
+    methods such as .text, .location or find_element, goes through the
+    driver's execute method. Installing the proxy there counts commands by
+    type and call site and records the time each one takes.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._lock = threading.Lock()
+        self._original_execute = driver.execute
+        self.commands = {}
+        self.call_sites = {}
+        self.total = 0
+        self.total_seconds = 0.0
+        self._unit_starts = {}
+        self.units = {}
+        driver.execute = self._execute
+
+    def attach(self, driver):
+        """Move the proxy to a restarted driver, keeping the counts so far"""
+        self.uninstall()
+        self.driver = driver
+        self._original_execute = driver.execute
+        driver.execute = self._execute
+
+    def uninstall(self):
+        """Restore the driver's original command channel"""
+        if self.driver.__dict__.get("execute") == self._execute:
+            del self.driver.execute
+
+    def _execute(self, driver_command, params=None):
+        site = _call_site()
+        started = time.perf_counter()
+        try:
+            return self._original_execute(driver_command, params)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.total += 1
+                self.total_seconds += elapsed
+                stats = self.commands.setdefault(driver_command, [0, 0.0])
+                stats[0] += 1
+                stats[1] += elapsed
+                key = f"{site} {driver_command}"
+                self.call_sites[key] = self.call_sites.get(key, 0) + 1
+
+    def start(self, unit):
+        """Begin counting round-trips for one card, page or other unit"""
+        self._unit_starts[unit] = self.total
+
+    def stop(self, unit):
+        """Record the round-trips made since start(unit) and return the count"""
+        started = self._unit_starts.pop(unit, None)
+        if started is None:
+            return 0
+        count = self.total - started
+        self.units.setdefault(unit, []).append(count)
+        return count
+
+    def report(self, top_sites=15):
+        """Return a summary of commands, call sites and per-unit round-trips"""
+        with self._lock:
+            commands = {
+                name: {"count": count, "seconds": round(seconds, 4)}
+                for name, (count, seconds) in sorted(self.commands.items(), key=lambda item: item[1][0], reverse=True)
+            }
+            sites = sorted(self.call_sites.items(), key=lambda item: item[1], reverse=True)[:top_sites]
+            units = {
+                unit: {
+                    "count": len(counts),
+                    "mean": round(sum(counts) / len(counts), 1),
+                    "max": max(counts),
+                }
+                for unit, counts in self.units.items() if counts
+            }
+            return {
+                "round_trips": self.total,
+                "seconds": round(self.total_seconds, 4),
+                "commands": commands,
+                "call_sites": dict(sites),
+                "per_unit": units,
+            }
+
+    def export(self, path):
+        """Write the report to a JSON file"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(top_sites=100), f, indent=2)